@@ -1,32 +1,34 @@
 """CLI entry point for registry test action."""
 
 import asyncio
-import json
 import logging
 import os
+import re
 import subprocess
 import sys
+from collections import Counter
+from collections.abc import Callable
 from pathlib import Path
 
 import typer
+from pydantic import ValidationError
 
-from boostsec.registry_test_action.models.provider_config import (
-    AzureDevOpsConfig,
-    BitbucketConfig,
-    GitHubConfig,
-    GitLabConfig,
-)
+from boostsec.registry_test_action.models.test_result import TestResult, TestStatus
 from boostsec.registry_test_action.orchestrator import TestOrchestrator
-from boostsec.registry_test_action.providers.azure import AzureDevOpsProvider
-from boostsec.registry_test_action.providers.base import PipelineProvider
-from boostsec.registry_test_action.providers.bitbucket import BitbucketProvider
-from boostsec.registry_test_action.providers.github import GitHubProvider
-from boostsec.registry_test_action.providers.gitlab import GitLabProvider
+from boostsec.registry_test_action.providers.base import JSON_CODEC, PipelineProvider
+
+
+def _log_format() -> str:
+    """Return the log format, omitting timestamps when the CI runner adds them."""
+    if os.environ.get("GITHUB_ACTIONS") == "true" and not sys.stderr.isatty():
+        return "%(name)s - %(levelname)s - %(message)s"
+    return "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
 
 # Configure logging - force reconfiguration
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    format=_log_format(),
     stream=sys.stderr,
     force=True,  # Force reconfiguration even if already set up
 )
@@ -34,10 +36,17 @@ logger = logging.getLogger(__name__)
 
 app = typer.Typer()
 
+_COMMIT_SHA_RE = re.compile(r"[0-9a-f]{40}")
+_FAILURE_STATUSES: frozenset[TestStatus] = frozenset(("failure", "error", "timeout"))
+
 
 def get_current_commit_sha(registry_path: Path) -> str:
     """Get the current commit SHA from the registry repository.
 
+    HEAD is read directly from the repository metadata when possible, falling
+    back to ``git rev-parse HEAD`` for layouts that are not handled in-process
+    (worktrees, submodules, symbolic refs to missing branches, ...).
+
     Args:
         registry_path: Path to the registry repository
 
@@ -48,6 +57,10 @@ def get_current_commit_sha(registry_path: Path) -> str:
         RuntimeError: If unable to get commit SHA
 
     """
+    sha = _read_head_sha(registry_path / ".git")
+    if sha is not None:
+        return sha
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],  # noqa: S607
@@ -63,6 +76,50 @@ def get_current_commit_sha(registry_path: Path) -> str:
         )
 
 
+def _read_head_sha(git_dir: Path) -> str | None:
+    """Resolve HEAD to a commit SHA by reading the git directory directly.
+
+    Returns None when HEAD cannot be resolved without invoking git.
+    """
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+
+    # Detached HEAD, which is how CI checkouts usually leave the repository
+    if _COMMIT_SHA_RE.fullmatch(head):
+        return head
+
+    if not head.startswith("ref: "):
+        return None
+
+    ref = head.removeprefix("ref: ")
+    sha: str | None
+    try:
+        sha = (git_dir / ref).read_text().strip()
+    except OSError:
+        sha = _read_packed_ref(git_dir, ref)
+
+    if sha is None or not _COMMIT_SHA_RE.fullmatch(sha):
+        return None
+    return sha
+
+
+def _read_packed_ref(git_dir: Path, ref: str) -> str | None:
+    """Look up a ref in the packed-refs file."""
+    try:
+        lines = (git_dir / "packed-refs").read_text().splitlines()
+    except OSError:
+        return None
+
+    for line in lines:
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+
+    return None
+
+
 @app.command()
 def main(  # noqa: C901
     registry_path: Path = typer.Option(..., help="Path to scanner registry repository"),  # noqa: B008
@@ -74,32 +131,35 @@ def main(  # noqa: C901
     provider_config: str = typer.Option(
         ..., help="JSON configuration for the provider"
     ),
+    quiet: bool = typer.Option(
+        False, "--quiet", help="Skip the JSON summary and only set the exit code"
+    ),
 ) -> None:
     """Run scanner tests on a CI/CD provider."""
     logger.info("=" * 80)
     logger.info("Scanner Registry Test Action - Starting")
     logger.info("=" * 80)
-    logger.info(f"Registry path: {registry_path}")
-    logger.info(f"Base ref: {base_ref}")
-    logger.info(f"Head ref: {head_ref}")
-    logger.info(f"Provider: {provider}")
-    logger.info(f"Working directory: {Path.cwd()}")
+    logger.info("Registry path: %s", registry_path)
+    logger.info("Base ref: %s", base_ref)
+    logger.info("Head ref: %s", head_ref)
+    logger.info("Provider: %s", provider)
+    logger.info("Working directory: %s", Path.cwd())
 
     # Get the exact commit SHA instead of using branch name
     try:
         registry_ref = get_current_commit_sha(registry_path)
-        logger.info(f"Registry commit SHA: {registry_ref}")
+        logger.info("Registry commit SHA: %s", registry_ref)
     except RuntimeError as e:
-        logger.error(f"Failed to get commit SHA: {e}")
+        logger.error("Failed to get commit SHA: %s", e)
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1)
 
     try:
         logger.info("Creating provider...")
         pipeline_provider = _create_provider(provider, provider_config)
-        logger.info(f"Provider created: {type(pipeline_provider).__name__}")
+        logger.info("Provider created: %s", type(pipeline_provider).__name__)
     except ValueError as e:
-        logger.error(f"Failed to create provider: {e}")
+        logger.error("Failed to create provider: %s", e)
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1)
 
@@ -110,7 +170,7 @@ def main(  # noqa: C901
         results = asyncio.run(
             orchestrator.run_tests(registry_path, base_ref, head_ref, registry_ref)
         )
-        logger.info(f"Test orchestration completed with {len(results)} results")
+        logger.info("Test orchestration completed with %d results", len(results))
     except Exception as e:
         logger.exception("Test execution failed")
         typer.echo(f"Error running tests: {e}", err=True)
@@ -126,49 +186,108 @@ def main(  # noqa: C901
     logger.info("=" * 80)
     for result in results:
         if result.status == "success":
-            msg = (
-                f"✓ {result.scanner}/{result.test_name}: {result.status} "
-                f"({result.duration:.2f}s)"
+            logger.info(
+                "✓ %s/%s: %s (%.2fs)",
+                result.scanner,
+                result.test_name,
+                result.status,
+                result.duration,
             )
-            logger.info(msg)
             if result.run_url:  # pragma: no cover
-                logger.info(f"  Run URL: {result.run_url}")
+                logger.info("  Run URL: %s", result.run_url)
         else:
-            logger.error(f"✗ {result.scanner}/{result.test_name}: {result.status}")
+            logger.error("✗ %s/%s: %s", result.scanner, result.test_name, result.status)
             if result.message:  # pragma: no cover
-                logger.error(f"  Message: {result.message}")
+                logger.error("  Message: %s", result.message)
             if result.run_url:  # pragma: no cover
-                logger.error(f"  Run URL: {result.run_url}")
+                logger.error("  Run URL: %s", result.run_url)
+
+    if quiet:
+        fail_count = sum(r.status in _FAILURE_STATUSES for r in results)
+    else:
+        fail_count = _write_summary(results)
+
+    if fail_count:
+        logger.error("Tests failed: %d/%d", fail_count, len(results))
+        raise typer.Exit(code=1)
+
+
+def _write_summary(results: list[TestResult]) -> int:
+    """Write the JSON results summary to stdout and return the failure count."""
+    counts: Counter[TestStatus] = Counter()
+    serialized: list[dict[str, object]] = []
+    for r in results:
+        counts[r.status] += 1
+        serialized.append(r.model_dump(mode="json"))
 
     output = {
         "total": len(results),
-        "passed": sum(1 for r in results if r.status == "success"),
-        "failed": sum(1 for r in results if r.status == "failure"),
-        "errors": sum(1 for r in results if r.status == "error"),
-        "timeouts": sum(1 for r in results if r.status == "timeout"),
-        "results": [
-            {
-                "provider": r.provider,
-                "scanner": r.scanner,
-                "test_name": r.test_name,
-                "status": r.status,
-                "duration": r.duration,
-                "message": r.message,
-                "run_url": r.run_url,
-            }
-            for r in results
-        ],
+        "passed": counts["success"],
+        "failed": counts["failure"],
+        "errors": counts["error"],
+        "timeouts": counts["timeout"],
+        "results": serialized,
     }
 
-    typer.echo(json.dumps(output, indent=2))
+    _write_json(output)
 
-    has_failures = any(r.status in {"failure", "error", "timeout"} for r in results)
-    if has_failures:
-        fail_count = sum(
-            1 for r in results if r.status in {"failure", "error", "timeout"}
-        )
-        logger.error(f"Tests failed: {fail_count}/{len(results)}")
-        raise typer.Exit(code=1)
+    return sum(counts[status] for status in _FAILURE_STATUSES)
+
+
+def _write_json(data: object) -> None:
+    """Write data as indented JSON to stdout without an intermediate str."""
+    sys.stdout.flush()
+    stdout = sys.stdout.buffer
+    stdout.write(JSON_CODEC.dump_json(data, indent=2))
+    stdout.write(b"\n")
+    stdout.flush()
+
+
+def _create_github_provider(config_dict: object) -> PipelineProvider:
+    """Create GitHub provider, honoring a GITHUB_API_URL override."""
+    from boostsec.registry_test_action.models.provider_config import GitHubConfig
+    from boostsec.registry_test_action.providers.github import GitHubProvider
+
+    config = GitHubConfig.model_validate(config_dict)
+    api_url = os.environ.get("GITHUB_API_URL")
+    if api_url is not None:
+        config = config.model_copy(update={"base_url": api_url})
+    return GitHubProvider(config)
+
+
+def _create_gitlab_provider(config_dict: object) -> PipelineProvider:
+    """Create GitLab provider."""
+    from boostsec.registry_test_action.models.provider_config import GitLabConfig
+    from boostsec.registry_test_action.providers.gitlab import GitLabProvider
+
+    return GitLabProvider(GitLabConfig.model_validate(config_dict))
+
+
+def _create_azure_provider(config_dict: object) -> PipelineProvider:
+    """Create Azure DevOps provider."""
+    from boostsec.registry_test_action.models.provider_config import (
+        AzureDevOpsConfig,
+    )
+    from boostsec.registry_test_action.providers.azure import AzureDevOpsProvider
+
+    return AzureDevOpsProvider(AzureDevOpsConfig.model_validate(config_dict))
+
+
+def _create_bitbucket_provider(config_dict: object) -> PipelineProvider:
+    """Create Bitbucket provider."""
+    from boostsec.registry_test_action.models.provider_config import BitbucketConfig
+    from boostsec.registry_test_action.providers.bitbucket import BitbucketProvider
+
+    return BitbucketProvider(BitbucketConfig.model_validate(config_dict))
+
+
+# Provider modules are imported by the factories since only one is used per run
+_PROVIDER_FACTORIES: dict[str, Callable[[object], PipelineProvider]] = {
+    "github": _create_github_provider,
+    "gitlab": _create_gitlab_provider,
+    "azure": _create_azure_provider,
+    "bitbucket": _create_bitbucket_provider,
+}
 
 
 def _create_provider(provider_type: str, config_json: str) -> PipelineProvider:
@@ -176,27 +295,20 @@ def _create_provider(provider_type: str, config_json: str) -> PipelineProvider:
     provider_type = provider_type.lower()
 
     try:
-        config_dict = json.loads(config_json)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in provider-config: {e}")
-
-    if provider_type == "github":
-        config = GitHubConfig(**config_dict)
-        if "GITHUB_API_URL" in os.environ:
-            config.base_url = os.environ["GITHUB_API_URL"]
-        return GitHubProvider(config)
-    elif provider_type == "gitlab":
-        return GitLabProvider(GitLabConfig(**config_dict))
-    elif provider_type == "azure":
-        return AzureDevOpsProvider(AzureDevOpsConfig(**config_dict))
-    elif provider_type == "bitbucket":
-        return BitbucketProvider(BitbucketConfig(**config_dict))
-    else:
+        config_dict = JSON_CODEC.validate_json(config_json)
+    except ValidationError as e:
+        error = e.errors()[0]["ctx"]["error"]
+        raise ValueError(f"Invalid JSON in provider-config: {error}")
+
+    factory = _PROVIDER_FACTORIES.get(provider_type)
+    if factory is None:
         raise ValueError(
             f"Unknown provider type: {provider_type}. "
-            "Must be one of: github, gitlab, azure, bitbucket"
+            f"Must be one of: {', '.join(_PROVIDER_FACTORIES)}"
         )
 
+    return factory(config_dict)
+
 
 if __name__ == "__main__":  # pragma: no cover
     app()
@@ -11,7 +11,7 @@ from boostsec.registry_test_action.models.test_definition import (
     TestDefinition,
     TestSource,
 )
-from boostsec.registry_test_action.models.test_result import TestResult
+from boostsec.registry_test_action.models.test_result import TestResult, TestStatus
 
 __all__ = [
     "AzureDevOpsConfig",
@@ -22,4 +22,5 @@ __all__ = [
     "TestDefinition",
     "TestResult",
     "TestSource",
+    "TestStatus",
 ]
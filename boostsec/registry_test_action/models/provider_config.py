@@ -1,11 +1,13 @@
 """Configuration models for CI/CD pipeline providers."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class GitHubConfig(BaseModel):
     """Configuration for GitHub Actions provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     token: str = Field(..., description="GitHub personal access token or GITHUB_TOKEN")
     owner: str = Field(..., description="Repository owner")
     repo: str = Field(..., description="Repository name")
@@ -22,6 +24,8 @@ class GitHubConfig(BaseModel):
 class GitLabConfig(BaseModel):
     """Configuration for GitLab CI provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     token: str = Field(..., description="GitLab personal access token")
     project_id: str = Field(..., description="GitLab project ID")
     ref: str = Field(default="main", description="Git reference to run pipeline on")
@@ -30,6 +34,8 @@ class GitLabConfig(BaseModel):
 class AzureDevOpsConfig(BaseModel):
     """Configuration for Azure DevOps provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     token: str = Field(..., description="Azure DevOps personal access token")
     organization: str = Field(..., description="Azure DevOps organization")
     project: str = Field(..., description="Azure DevOps project name")
@@ -39,6 +45,8 @@ class AzureDevOpsConfig(BaseModel):
 class BitbucketConfig(BaseModel):
     """Configuration for Bitbucket Pipelines provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     username: str = Field(
         ..., description="Bitbucket account email (e.g., user@company.com)"
     )
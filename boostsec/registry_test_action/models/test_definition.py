@@ -2,7 +2,7 @@
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TestSource(BaseModel):
@@ -10,6 +10,8 @@ class TestSource(BaseModel):
 
     __test__ = False
 
+    model_config = ConfigDict(frozen=True)
+
     url: str = Field(..., description="Git repository URL (HTTPS only)")
     ref: str = Field(..., description="Git reference (branch, tag, or commit SHA)")
 
@@ -19,6 +21,8 @@ class Test(BaseModel):
 
     __test__ = False
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Human-readable test name")
     type: Literal["source-code", "docker-image"] = Field(
         ..., description="Type of test to execute"
@@ -38,5 +42,7 @@ class TestDefinition(BaseModel):
 
     __test__ = False
 
+    model_config = ConfigDict(frozen=True)
+
     version: str = Field(..., description="Test definition schema version")
     tests: list[Test] = Field(default_factory=list, description="List of tests")
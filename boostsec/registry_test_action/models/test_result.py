@@ -2,7 +2,9 @@
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+TestStatus = Literal["success", "failure", "timeout", "error"]
 
 
 class TestResult(BaseModel):
@@ -10,12 +12,12 @@ class TestResult(BaseModel):
 
     __test__ = False
 
+    model_config = ConfigDict(frozen=True)
+
     provider: str = Field(..., description="CI/CD provider name")
     scanner: str = Field(..., description="Scanner identifier")
     test_name: str = Field(..., description="Test name")
-    status: Literal["success", "failure", "timeout", "error"] = Field(
-        ..., description="Test execution status"
-    )
+    status: TestStatus = Field(..., description="Test execution status")
     duration: float = Field(..., description="Execution time in seconds")
     message: str | None = Field(
         default=None, description="Error message or status details"
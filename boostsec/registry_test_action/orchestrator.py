@@ -1,9 +1,10 @@
 """Test orchestrator for coordinating test execution on a single provider."""
 
 import asyncio
+import configparser
 import logging
 import subprocess
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Sequence
 from pathlib import Path
 
 from boostsec.registry_test_action.models.test_definition import (
@@ -31,19 +32,7 @@ def get_repository_identifier(registry_path: Path) -> str:
         RuntimeError: If unable to get repository URL or parse it
 
     """
-    try:
-        result = subprocess.run(
-            ["git", "config", "--get", "remote.origin.url"],  # noqa: S607
-            cwd=registry_path,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        url = result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(
-            f"Failed to get repository URL from {registry_path}: {e.stderr}"
-        )
+    url = _get_origin_url(registry_path)
 
     # Parse org/repo from URL
     # Supports: https://github.com/org/repo.git, git@github.com:org/repo.git
@@ -66,14 +55,66 @@ def get_repository_identifier(registry_path: Path) -> str:
     raise RuntimeError(f"Unable to parse repository identifier from URL: {url}")
 
 
+def _get_origin_url(registry_path: Path) -> str:
+    """Get the origin remote URL of the git repository.
+
+    The URL is read from .git/config directly, falling back to ``git config``
+    when it is not available there (e.g. worktrees).
+    """
+    url = _read_origin_url(registry_path / ".git")
+    if url is not None:
+        return url
+
+    try:
+        result = subprocess.run(
+            ["git", "config", "--get", "remote.origin.url"],  # noqa: S607
+            cwd=registry_path,
+            capture_output=True,
+            check=True,
+        )
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(
+            f"Failed to get repository URL from {registry_path}: "
+            f"{e.stderr.decode(errors='replace')}"
+        )
+    return result.stdout.decode().strip()
+
+
+def _read_origin_url(git_dir: Path) -> str | None:
+    """Read the origin remote URL from a git config file, if present."""
+    parser = configparser.ConfigParser(strict=False, interpolation=None)
+    try:
+        parser.read(git_dir / "config", encoding="utf-8")
+    except (configparser.Error, ValueError):
+        return None
+
+    url = parser.get('remote "origin"', "url", fallback=None)
+    # configparser keeps the quotes, escapes and inline comments that git
+    # strips, so anything beyond a plain value is left to git itself.
+    if url is None or any(char in url for char in '"\\;#'):
+        return None
+    return url
+
+
 class TestOrchestrator:
     """Orchestrates test execution on a single provider."""
 
     __test__ = False
 
-    def __init__(self, provider: PipelineProvider) -> None:
-        """Initialize orchestrator with a single provider."""
+    def __init__(
+        self,
+        provider: PipelineProvider,
+        max_dispatch_concurrency: int = 4,
+    ) -> None:
+        """Initialize orchestrator with a single provider.
+
+        Args:
+            provider: Provider to run the tests on
+            max_dispatch_concurrency: Maximum number of dispatch requests at once
+
+        """
         self.provider = provider
+        self._dispatch_semaphore = asyncio.Semaphore(max_dispatch_concurrency)
 
     async def run_tests(
         self,
@@ -83,13 +124,15 @@ class TestOrchestrator:
         registry_ref: str,
     ) -> list[TestResult]:
         """Run all tests for changed scanners on the configured provider."""
-        logger.info("Getting registry identifier...")
-        registry_repo = get_repository_identifier(registry_path)
+        # The registry identifier and the changed scanners are independent git
+        # lookups, so they run concurrently.
+        logger.info("Getting registry identifier and detecting changed scanners...")
+        registry_repo, scanner_ids = await asyncio.gather(
+            asyncio.to_thread(get_repository_identifier, registry_path),
+            detect_changed_scanners(registry_path, base_ref, head_ref),
+        )
         logger.info(f"Registry repository: {registry_repo}")
 
-        logger.info("Detecting changed scanners...")
-        scanner_ids = await detect_changed_scanners(registry_path, base_ref, head_ref)
-
         if not scanner_ids:
             logger.info("No changed scanners detected")
             return []
@@ -105,10 +148,46 @@ class TestOrchestrator:
         logger.info(f"Built {len(tasks)} test tasks")
 
         logger.info("Executing tests...")
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        running = [asyncio.ensure_future(task) for task in tasks]
+        try:
+            results = await self._collect_results(running)
+        finally:
+            # Tasks are only left running when the loop was aborted (e.g. by
+            # cancellation); stop them before their provider session closes.
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            await self.provider.aclose()
         logger.info("Test execution completed")
 
-        return self._process_results(list(results))
+        return results
+
+    async def _collect_results(
+        self, running: Sequence[asyncio.Future[TestResult]]
+    ) -> list[TestResult]:
+        """Handle each test as it finishes and return results in dispatch order.
+
+        Results are logged as soon as each test finishes rather than once the
+        slowest one is done, but are stored by position so the returned list
+        follows the order the tests were built in.
+        """
+        positions = {task: i for i, task in enumerate(running)}
+        results: dict[int, TestResult] = {}
+        pending = set(running)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                # Failures are converted inside the handler so the exception and
+                # its traceback are released as soon as they have been logged.
+                try:
+                    result = self._process_result(task.result())
+                except Exception as e:  # noqa: BLE001
+                    result = self._process_result(e)
+                results[positions[task]] = result
+
+        return [results[i] for i in range(len(running))]
 
     def _build_test_tasks(
         self,
@@ -118,45 +197,32 @@ class TestOrchestrator:
         registry_repo: str,
     ) -> list[Awaitable[TestResult]]:
         """Build list of test tasks to execute."""
-        tasks: list[Awaitable[TestResult]] = []
-        for scanner_id in scanner_ids:
-            test_def = test_definitions.get(scanner_id)
-            if not test_def:
-                continue
-
-            for test in test_def.tests:
-                task = self._run_single_test(
-                    scanner_id, test, registry_ref, registry_repo
-                )
-                tasks.append(task)
-
-        return tasks
-
-    def _process_results(
-        self, results: list[TestResult | BaseException]
-    ) -> list[TestResult]:
-        """Process results from test execution."""
-        final_results: list[TestResult] = []
-        for result in results:
-            if isinstance(result, TestResult):
-                test_id = f"{result.scanner}/{result.test_name}"
-                logger.info(f"Test result: {test_id} = {result.status}")
-                final_results.append(result)
-            elif isinstance(result, Exception):
-                logger.error(
-                    f"Test execution error: {type(result).__name__}: {result}",
-                    exc_info=result,
-                )
-                error_result = TestResult(
-                    provider="unknown",
-                    scanner="unknown",
-                    test_name="unknown",
-                    status="error",
-                    duration=0.0,
-                    message=str(result),
-                )
-                final_results.append(error_result)
-        return final_results
+        return [
+            self._run_single_test(scanner_id, test, registry_ref, registry_repo)
+            for scanner_id in scanner_ids
+            if (test_def := test_definitions.get(scanner_id))
+            for test in test_def.tests
+        ]
+
+    def _process_result(self, result: TestResult | Exception) -> TestResult:
+        """Log a finished test and turn failures into error results."""
+        if isinstance(result, TestResult):
+            test_id = f"{result.scanner}/{result.test_name}"
+            logger.info(f"Test result: {test_id} = {result.status}")
+            return result
+
+        logger.error(
+            f"Test execution error: {type(result).__name__}: {result}",
+            exc_info=result,
+        )
+        return TestResult(
+            provider="unknown",
+            scanner="unknown",
+            test_name="unknown",
+            status="error",
+            duration=0.0,
+            message=str(result),
+        )
 
     async def _run_single_test(
         self,
@@ -166,16 +232,18 @@ class TestOrchestrator:
         registry_repo: str,
     ) -> TestResult:
         """Run a single test on the provider and wait for completion."""
-        logger.info(f"Dispatching test: {scanner_id}/{test.name}")
-        run_id = await self.provider.dispatch_test(
-            scanner_id, test, registry_ref, registry_repo
-        )
+        # Only dispatch is limited: it is a short burst of API calls, while
+        # finding the run and waiting for it are long-lived and every test must
+        # run in parallel.
+        async with self._dispatch_semaphore:
+            logger.info(f"Dispatching test: {scanner_id}/{test.name}")
+            run_id = await self.provider.dispatch_test(
+                scanner_id, test, registry_ref, registry_repo
+            )
+        run_id = await self.provider.find_run(run_id)
         logger.info(f"Test dispatched with run_id: {run_id}")
 
         logger.info(f"Waiting for test completion: {scanner_id}/{test.name}")
         result = await self.provider.wait_for_completion(run_id)
 
-        result.scanner = scanner_id
-        result.test_name = test.name
-
-        return result
+        return result.model_copy(update={"scanner": scanner_id, "test_name": test.name})
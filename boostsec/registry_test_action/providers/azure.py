@@ -3,14 +3,18 @@
 import base64
 import json
 from collections.abc import Mapping
-from typing import Literal
-
-import aiohttp
 
 from boostsec.registry_test_action.models.provider_config import AzureDevOpsConfig
 from boostsec.registry_test_action.models.test_definition import Test
-from boostsec.registry_test_action.models.test_result import TestResult
-from boostsec.registry_test_action.providers.base import PipelineProvider
+from boostsec.registry_test_action.models.test_result import TestResult, TestStatus
+from boostsec.registry_test_action.providers.base import JSON_CODEC, PipelineProvider
+
+_RESULT_MAP: dict[str, TestStatus] = {
+    "succeeded": "success",
+    "failed": "failure",
+    "canceled": "error",
+    "skipped": "error",
+}
 
 
 class AzureDevOpsProvider(PipelineProvider):
@@ -24,6 +28,14 @@ class AzureDevOpsProvider(PipelineProvider):
         auth_string = f":{config.token}"
         auth_bytes = auth_string.encode("ascii")
         self._auth_header = f"Basic {base64.b64encode(auth_bytes).decode('ascii')}"
+        runs_path = (
+            f"{self.base_url}/{config.organization}/{config.project}/"
+            f"_apis/pipelines/{config.pipeline_id}/runs"
+        )
+        self._runs_url = f"{runs_path}?api-version=7.1"
+        self._run_url_prefix = f"{runs_path}/"
+        self._headers = {"Authorization": self._auth_header}
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
 
     async def dispatch_test(
         self,
@@ -33,42 +45,36 @@ class AzureDevOpsProvider(PipelineProvider):
         registry_repo: str,
     ) -> str:
         """Run pipeline and return run ID."""
-        async with aiohttp.ClientSession() as session:
-            url = (
-                f"{self.base_url}/{self.config.organization}/{self.config.project}/"
-                f"_apis/pipelines/{self.config.pipeline_id}/runs?api-version=7.1"
-            )
-            headers = {
-                "Authorization": self._auth_header,
-                "Content-Type": "application/json",
-            }
-            template_params = {
-                "SCANNER_ID": scanner_id,
-                "TEST_NAME": test.name,
-                "TEST_TYPE": test.type,
-                "SOURCE_URL": test.source.url,
-                "SOURCE_REF": test.source.ref,
-                "REGISTRY_REF": registry_ref,
-                "REGISTRY_REPO": registry_repo,
-                "SCAN_PATHS": json.dumps(test.scan_paths),
-                "TIMEOUT": test.timeout,
-            }
-
-            if test.scan_configs is not None:
-                template_params["SCAN_CONFIGS"] = json.dumps(test.scan_configs)
-
-            payload = {
-                "templateParameters": template_params,
-            }
-
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise RuntimeError(
-                        f"Failed to run pipeline: {response.status} {text}"
-                    )
-
-                data: Mapping[str, object] = await response.json()
+        session = self._get_session()
+        template_params = {
+            "SCANNER_ID": scanner_id,
+            "TEST_NAME": test.name,
+            "TEST_TYPE": test.type,
+            "SOURCE_URL": test.source.url,
+            "SOURCE_REF": test.source.ref,
+            "REGISTRY_REF": registry_ref,
+            "REGISTRY_REPO": registry_repo,
+            "SCAN_PATHS": json.dumps(test.scan_paths),
+            "TIMEOUT": test.timeout,
+        }
+
+        if test.scan_configs is not None:
+            template_params["SCAN_CONFIGS"] = json.dumps(test.scan_configs)
+
+        payload = {
+            "templateParameters": template_params,
+        }
+
+        async with session.post(
+            self._runs_url,
+            headers=self._json_headers,
+            data=JSON_CODEC.dump_json(payload),
+        ) as response:
+            if response.status != 200:
+                text = await response.text()
+                raise RuntimeError(f"Failed to run pipeline: {response.status} {text}")
+
+            data: Mapping[str, object] = JSON_CODEC.validate_json(await response.read())
 
         run_id = data.get("id")
         if not isinstance(run_id, int):
@@ -78,49 +84,30 @@ class AzureDevOpsProvider(PipelineProvider):
 
     async def poll_status(self, run_id: str) -> tuple[bool, TestResult]:
         """Check if pipeline run is complete and get result."""
-        async with aiohttp.ClientSession() as session:
-            url = (
-                f"{self.base_url}/{self.config.organization}/{self.config.project}/"
-                f"_apis/pipelines/{self.config.pipeline_id}/runs/{run_id}"
-                "?api-version=7.1"
-            )
-            headers = {
-                "Authorization": self._auth_header,
-            }
-
-            async with session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise RuntimeError(
-                        f"Failed to get pipeline run: {response.status} {text}"
-                    )
-
-                data: Mapping[str, object] = await response.json()
+        session = self._get_session()
+        url = f"{self._run_url_prefix}{run_id}?api-version=7.1"
+
+        async with session.get(url, headers=self._headers) as response:
+            if response.status != 200:
+                text = await response.text()
+                raise RuntimeError(
+                    f"Failed to get pipeline run: {response.status} {text}"
+                )
+
+            data: Mapping[str, object] = JSON_CODEC.validate_json(await response.read())
 
         state_str = data.get("state")
         result_str = data.get("result")
-        web_url = ""
-        if isinstance(data.get("_links"), dict):
-            links = data["_links"]
-            if isinstance(links, dict) and isinstance(links.get("web"), dict):
-                web = links["web"]
-                if isinstance(web, dict):
-                    web_url = str(web.get("href", ""))
+        try:
+            web_url = str(data["_links"]["web"]["href"])  # type: ignore[index]
+        except (KeyError, TypeError):
+            web_url = ""
 
         is_complete = state_str in {"completed", "canceling"}
 
-        if not is_complete:
-            result = TestResult(
-                provider="azure",
-                scanner="unknown",
-                test_name="unknown",
-                status="error",
-                duration=0.0,
-                run_url=web_url,
-            )
-            return (False, result)
-
-        test_status = self._map_result(str(result_str))
+        test_status: TestStatus = (
+            self._map_result(str(result_str)) if is_complete else "error"
+        )
 
         result = TestResult(
             provider="azure",
@@ -131,16 +118,8 @@ class AzureDevOpsProvider(PipelineProvider):
             run_url=web_url,
         )
 
-        return (True, result)
+        return (is_complete, result)
 
-    def _map_result(
-        self, result: str
-    ) -> Literal["success", "failure", "timeout", "error"]:
+    def _map_result(self, result: str) -> TestStatus:
         """Map Azure DevOps result to test status."""
-        mapping: dict[str, Literal["success", "failure", "timeout", "error"]] = {
-            "succeeded": "success",
-            "failed": "failure",
-            "canceled": "error",
-            "skipped": "error",
-        }
-        return mapping.get(result, "error")
+        return _RESULT_MAP.get(result, "error")
@@ -1,15 +1,191 @@
 """Abstract base class for CI/CD pipeline providers."""
 
 import asyncio
+import contextlib
+import random
+import time
 from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any
+
+import aiohttp
+from pydantic import TypeAdapter
 
 from boostsec.registry_test_action.models.test_definition import Test
 from boostsec.registry_test_action.models.test_result import TestResult
 
+PollOutcome = tuple[bool, TestResult] | BaseException
+
+# Untyped JSON codec for request and response bodies, backed by pydantic's
+# parser and serializer
+JSON_CODEC: TypeAdapter[Any] = TypeAdapter(Any)
+
+# Bounds connecting and each read so a stalled connection cannot hang a
+# dispatch or a poll tick for aiohttp's default five minutes. There is no total
+# limit: it would also cover the rate-limit retry middleware's sleeps.
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(connect=10, sock_read=30)
+
+# Rate-limited requests are retried after the delay the API asks for, unless
+# the limit resets later than a poll tick could reasonably wait.
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_DEFAULT_DELAY = 1.0
+_RATE_LIMIT_MAX_DELAY = 60.0
+
+
+def _parse_delay(value: str) -> float:
+    """Parse a Retry-After delay in seconds, falling back to a default."""
+    try:
+        return float(value)
+    except ValueError:
+        # HTTP-date form, rarely used by CI APIs
+        return _RATE_LIMIT_DEFAULT_DELAY
+
+
+def _rate_limit_delay(response: aiohttp.ClientResponse) -> float | None:
+    """Return how long to wait before retrying a rate-limited response.
+
+    Returns None if the response was not rate limited, or if the limit resets
+    too far in the future to be worth waiting for.
+    """
+    if response.status not in (403, 429):
+        return None
+
+    headers = response.headers
+    if "Retry-After" in headers:
+        delay = _parse_delay(headers["Retry-After"])
+    elif headers.get("X-RateLimit-Remaining") == "0":
+        # GitHub's primary limit: wait until the advertised reset time
+        reset = _parse_delay(headers.get("X-RateLimit-Reset", ""))
+        delay = reset - time.time()
+    elif response.status == 429:
+        delay = _RATE_LIMIT_DEFAULT_DELAY
+    else:
+        # A plain 403 is a permission error, not a rate limit
+        return None
+
+    if delay > _RATE_LIMIT_MAX_DELAY:
+        return None
+    return max(delay, 0.0)
+
+
+async def _retry_rate_limited(
+    request: aiohttp.ClientRequest, handler: aiohttp.ClientHandlerType
+) -> aiohttp.ClientResponse:
+    """Session middleware retrying requests rejected by API rate limits."""
+    for _ in range(_RATE_LIMIT_RETRIES):
+        response = await handler(request)
+        delay = _rate_limit_delay(response)
+        if delay is None:
+            return response
+        response.release()
+        await asyncio.sleep(delay)
+    return await handler(request)
+
+
+class _RunPoller:
+    """Poll every pending run of a provider from a single background task.
+
+    Each tick the poller polls all pending runs concurrently, then resolves the
+    futures of the runs that completed. Waiters on the same run share one
+    future, so a run is only ever polled once per tick. The tick interval
+    honors the shortest one requested by any waiter, and a newly registered
+    run wakes the poller so it is polled right away.
+    """
+
+    def __init__(self, provider: "PipelineProvider") -> None:
+        self._provider = provider
+        self._pending: dict[str, asyncio.Future[TestResult]] = {}
+        self._intervals: dict[str, tuple[float, float]] = {}
+        self._waiters: Counter[str] = Counter()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def wait(
+        self, run_id: str, poll_interval: float, max_poll_interval: float
+    ) -> TestResult:
+        """Register a run and wait until the poller resolves it."""
+        future = self._pending.get(run_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[run_id] = future
+            self._intervals[run_id] = (poll_interval, max_poll_interval)
+            self._wakeup.set()
+        else:
+            interval, max_interval = self._intervals[run_id]
+            self._intervals[run_id] = (
+                min(interval, poll_interval),
+                min(max_interval, max_poll_interval),
+            )
+        self._waiters[run_id] += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll())
+        try:
+            # Shielded so a waiter timing out does not cancel the shared future.
+            return await asyncio.shield(future)
+        finally:
+            self._waiters[run_id] -= 1
+            if not self._waiters[run_id]:
+                del self._waiters[run_id]
+                self._pending.pop(run_id, None)
+                self._intervals.pop(run_id, None)
+
+    async def _poll(self) -> None:
+        delay = 0.0
+        polled: set[str] = set()
+
+        while self._pending:
+            self._wakeup.clear()
+            run_ids = list(self._pending)
+            poll_interval = min(i for i, _ in self._intervals.values())
+            max_poll_interval = min(m for _, m in self._intervals.values())
+            # Newly registered runs restart the backoff so they are picked up
+            # quickly even if older runs have been pending for a long time.
+            if not polled.issuperset(run_ids):
+                delay = poll_interval
+            polled.update(run_ids)
+
+            outcomes = await asyncio.gather(
+                *(self._provider.poll_status(run_id) for run_id in run_ids),
+                return_exceptions=True,
+            )
+            self._resolve(dict(zip(run_ids, outcomes, strict=True)))
+            if all(future.done() for future in self._pending.values()):
+                return
+
+            delay = min(delay, max_poll_interval)
+            jitter = random.uniform(0, delay * 0.1)  # noqa: S311
+            await self._sleep(delay + jitter)
+            delay = min(delay * 1.5, max_poll_interval)
+
+    async def _sleep(self, delay: float) -> None:
+        """Wait for the next tick, or until a new run is registered."""
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), delay)
+
+    def _resolve(self, outcomes: dict[str, PollOutcome]) -> None:
+        for run_id, outcome in outcomes.items():
+            future = self._pending.get(run_id)
+            if future is None or future.done():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            elif outcome[0]:
+                future.set_result(outcome[1])
+
+    async def aclose(self) -> None:
+        """Stop the background polling task."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
 
 class PipelineProvider(ABC):
     """Abstract base for CI/CD pipeline providers."""
 
+    _session: aiohttp.ClientSession | None = None
+    _poller: _RunPoller | None = None
+
     @abstractmethod
     async def dispatch_test(
         self,
@@ -26,10 +202,28 @@ class PipelineProvider(ABC):
             registry_ref: Git ref of the registry (for checking out scanner)
             registry_repo: Registry repository in org/repo format
 
+        Returns:
+            Run identifier for polling status, or a dispatch identifier to pass
+            to find_run
+
+        """
+
+    async def find_run(self, run_id: str) -> str:
+        """Return the run started by a dispatch.
+
+        Providers whose dispatch API does not report the run it started return
+        a dispatch identifier from dispatch_test and override this to look the
+        run up. The lookup is kept apart from dispatch_test because the run can
+        take a while to be registered.
+
+        Args:
+            run_id: Identifier returned by dispatch_test
+
         Returns:
             Run identifier for polling status
 
         """
+        return run_id
 
     @abstractmethod
     async def poll_status(self, run_id: str) -> tuple[bool, TestResult]:
@@ -43,18 +237,56 @@ class PipelineProvider(ABC):
 
         """
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the provider's HTTP session, creating it on first use.
+
+        The session is shared by every request made through the provider so
+        connections are kept alive across dispatch and poll calls. Requests
+        rejected by an API rate limit are retried after the advertised delay.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=20,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=_REQUEST_TIMEOUT,
+                middlewares=(_retry_rate_limited,),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the provider's HTTP session, if one was opened."""
+        if self._poller is not None:
+            await self._poller.aclose()
+            self._poller = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def wait_for_completion(
         self,
         run_id: str,
         timeout: float = 1800,
-        poll_interval: float = 30,
+        poll_interval: float = 5,
+        max_poll_interval: float = 60,
     ) -> TestResult:
         """Wait for test run to complete.
 
+        All runs awaited at the same time share one polling loop, which checks
+        them together on each tick. The delay between polls starts at
+        poll_interval and grows exponentially, with a little jitter, up to
+        max_poll_interval. Short runs are picked up quickly while long runs are
+        polled less often.
+
         Args:
             run_id: Run identifier from dispatch_test
             timeout: Maximum wait time in seconds (default: 30 minutes)
-            poll_interval: Seconds between polls (default: 30)
+            poll_interval: Seconds before the first re-poll (default: 5)
+            max_poll_interval: Upper bound on seconds between polls (default: 60)
 
         Returns:
             Final test result
@@ -63,19 +295,17 @@ class PipelineProvider(ABC):
             TimeoutError: If run doesn't complete within timeout
 
         """
-        start_time = asyncio.get_event_loop().time()
-        end_time = start_time + timeout
-
-        while True:
-            is_complete, result = await self.poll_status(run_id)
-
-            if is_complete:
-                return result
-
-            current_time = asyncio.get_event_loop().time()
-            if current_time >= end_time:
-                raise TimeoutError(
-                    f"Test run {run_id} did not complete within {timeout} seconds"
-                )
+        if self._poller is None:
+            self._poller = _RunPoller(self)
 
-            await asyncio.sleep(poll_interval)
+        try:
+            async with asyncio.timeout(timeout) as deadline:
+                return await self._poller.wait(run_id, poll_interval, max_poll_interval)
+        except TimeoutError:
+            # A TimeoutError raised by the poll itself (e.g. a request timing
+            # out) is a different failure and propagates unchanged.
+            if not deadline.expired():
+                raise
+            raise TimeoutError(
+                f"Test run {run_id} did not complete within {timeout} seconds"
+            ) from None
@@ -3,14 +3,32 @@
 import base64
 import json
 from collections.abc import Mapping
-from typing import Literal
-
-import aiohttp
+from typing import NamedTuple
 
 from boostsec.registry_test_action.models.provider_config import BitbucketConfig
 from boostsec.registry_test_action.models.test_definition import Test
-from boostsec.registry_test_action.models.test_result import TestResult
-from boostsec.registry_test_action.providers.base import PipelineProvider
+from boostsec.registry_test_action.models.test_result import TestResult, TestStatus
+from boostsec.registry_test_action.providers.base import JSON_CODEC, PipelineProvider
+
+_RESULT_MAP: dict[str, TestStatus] = {
+    "SUCCESSFUL": "success",
+    "FAILED": "failure",
+    "ERROR": "error",
+    "STOPPED": "error",
+}
+
+_TERMINAL_STATES = frozenset({"COMPLETED", "STOPPED", "ERROR", "FAILED"})
+
+
+class _PipelineContext(NamedTuple):
+    """Test a dispatched pipeline belongs to, and where to view it."""
+
+    scanner_id: str
+    test_name: str
+    run_url: str
+
+
+_UNKNOWN_CONTEXT = _PipelineContext("unknown", "unknown", "")
 
 
 class BitbucketProvider(PipelineProvider):
@@ -21,11 +39,26 @@ class BitbucketProvider(PipelineProvider):
         self.config = config
         self.base_url = "https://api.bitbucket.org/2.0"
         # Store test context and URLs for each pipeline to populate TestResult correctly
-        self._pipeline_context: dict[str, tuple[str, str, str]] = {}
+        self._pipeline_context: dict[str, _PipelineContext] = {}
         # Bitbucket uses Basic auth with username:api_token
         auth_string = f"{config.username}:{config.api_token}"
         auth_bytes = auth_string.encode("utf-8")
         self._auth_header = f"Basic {base64.b64encode(auth_bytes).decode('utf-8')}"
+        self._pipelines_url = (
+            f"{self.base_url}/repositories/{config.workspace}/"
+            f"{config.repo_slug}/pipelines/"
+        )
+        self._headers = {"Authorization": self._auth_header}
+        self._target = {
+            "type": "pipeline_ref_target",
+            "selector": {
+                "type": "custom",
+                "pattern": "test-scanner",
+            },
+            "ref_name": config.branch,
+            "ref_type": "branch",
+        }
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
 
     async def dispatch_test(
         self,
@@ -35,53 +68,39 @@ class BitbucketProvider(PipelineProvider):
         registry_repo: str,
     ) -> str:
         """Trigger pipeline and return pipeline UUID."""
-        async with aiohttp.ClientSession() as session:
-            url = (
-                f"{self.base_url}/repositories/{self.config.workspace}/"
-                f"{self.config.repo_slug}/pipelines/"
-            )
-            headers = {
-                "Authorization": self._auth_header,
-                "Content-Type": "application/json",
-            }
-            variables = [
-                {"key": "SCANNER_ID", "value": scanner_id},
-                {"key": "TEST_NAME", "value": test.name},
-                {"key": "TEST_TYPE", "value": test.type},
-                {"key": "SOURCE_URL", "value": test.source.url},
-                {"key": "SOURCE_REF", "value": test.source.ref},
-                {"key": "REGISTRY_REF", "value": registry_ref},
-                {"key": "REGISTRY_REPO", "value": registry_repo},
-                {"key": "SCAN_PATHS", "value": json.dumps(test.scan_paths)},
-                {"key": "TIMEOUT", "value": test.timeout},
-            ]
-
-            if test.scan_configs is not None:
-                variables.append(
-                    {"key": "SCAN_CONFIGS", "value": json.dumps(test.scan_configs)}
+        session = self._get_session()
+        variables = [
+            ("SCANNER_ID", scanner_id),
+            ("TEST_NAME", test.name),
+            ("TEST_TYPE", test.type),
+            ("SOURCE_URL", test.source.url),
+            ("SOURCE_REF", test.source.ref),
+            ("REGISTRY_REF", registry_ref),
+            ("REGISTRY_REPO", registry_repo),
+            ("SCAN_PATHS", json.dumps(test.scan_paths)),
+            ("TIMEOUT", test.timeout),
+        ]
+
+        if test.scan_configs is not None:
+            variables.append(("SCAN_CONFIGS", json.dumps(test.scan_configs)))
+
+        payload = {
+            "target": self._target,
+            "variables": [{"key": key, "value": value} for key, value in variables],
+        }
+
+        async with session.post(
+            self._pipelines_url,
+            headers=self._json_headers,
+            data=JSON_CODEC.dump_json(payload),
+        ) as response:
+            if response.status != 201:
+                text = await response.text()
+                raise RuntimeError(
+                    f"Failed to trigger pipeline: {response.status} {text}"
                 )
 
-            payload = {
-                "target": {
-                    "type": "pipeline_ref_target",
-                    "selector": {
-                        "type": "custom",
-                        "pattern": "test-scanner",
-                    },
-                    "ref_name": self.config.branch,
-                    "ref_type": "branch",
-                },
-                "variables": variables,
-            }
-
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status != 201:
-                    text = await response.text()
-                    raise RuntimeError(
-                        f"Failed to trigger pipeline: {response.status} {text}"
-                    )
-
-                data: Mapping[str, object] = await response.json()
+            data: Mapping[str, object] = JSON_CODEC.validate_json(await response.read())
 
         pipeline_uuid = data.get("uuid")
         if not isinstance(pipeline_uuid, str):
@@ -102,7 +121,9 @@ class BitbucketProvider(PipelineProvider):
             run_url = ""
 
         # Store test context and URL for later use in poll_status
-        self._pipeline_context[pipeline_id] = (scanner_id, test.name, run_url)
+        self._pipeline_context[pipeline_id] = _PipelineContext(
+            scanner_id, test.name, run_url
+        )
 
         return pipeline_id
 
@@ -110,50 +131,28 @@ class BitbucketProvider(PipelineProvider):
         """Check if pipeline is complete and get result."""
         # Retrieve stored test context and URL
         scanner, test_name, run_url = self._pipeline_context.get(
-            run_id, ("unknown", "unknown", "")
+            run_id, _UNKNOWN_CONTEXT
         )
 
         data = await self._fetch_pipeline_status(run_id)
 
         state_info = data.get("state")
-
         if not isinstance(state_info, dict):
-            result = TestResult(
-                provider="bitbucket",
-                scanner=scanner,
-                test_name=test_name,
-                status="error",
-                duration=0.0,
-                run_url=run_url,
-            )
-            return (False, result)
-
-        state_name = state_info.get("name")
-
-        # Check for terminal states
-        terminal_states = {"COMPLETED", "STOPPED", "ERROR", "FAILED"}
-        is_complete = state_name in terminal_states
-
-        if not is_complete:
-            # Still running (PENDING, IN_PROGRESS)
-            result = TestResult(
-                provider="bitbucket",
-                scanner=scanner,
-                test_name=test_name,
-                status="error",
-                duration=0.0,
-                run_url=run_url,
-            )
-            return (False, result)
+            state_info = {}
 
-        # Pipeline completed, check the result
-        result_info = state_info.get("result", {})
-        if isinstance(result_info, dict):
-            result_name = result_info.get("name", "")
-        else:
-            result_name = ""
+        # Anything but a terminal state is still running (PENDING, IN_PROGRESS)
+        is_complete = state_info.get("name") in _TERMINAL_STATES
+        test_status: TestStatus = "error"
+
+        if is_complete:
+            # Pipeline completed, its context is no longer needed
+            self._pipeline_context.pop(run_id, None)
 
-        test_status = self._map_result(str(result_name))
+            try:
+                result_name = state_info["result"]["name"]
+            except (KeyError, TypeError):
+                result_name = ""
+            test_status = self._map_result(str(result_name))
 
         result = TestResult(
             provider="bitbucket",
@@ -164,38 +163,22 @@ class BitbucketProvider(PipelineProvider):
             run_url=run_url,
         )
 
-        return (True, result)
+        return (is_complete, result)
 
     async def _fetch_pipeline_status(self, run_id: str) -> Mapping[str, object]:
         """Fetch pipeline status from Bitbucket API."""
-        async with aiohttp.ClientSession() as session:
-            url = (
-                f"{self.base_url}/repositories/{self.config.workspace}/"
-                f"{self.config.repo_slug}/pipelines/{{{run_id}}}"
-            )
-            headers = {
-                "Authorization": self._auth_header,
-            }
+        session = self._get_session()
+        url = f"{self._pipelines_url}{{{run_id}}}"
 
-            async with session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise RuntimeError(
-                        f"Failed to get pipeline: {response.status} {text}"
-                    )
+        async with session.get(url, headers=self._headers) as response:
+            if response.status != 200:
+                text = await response.text()
+                raise RuntimeError(f"Failed to get pipeline: {response.status} {text}")
 
-                data: Mapping[str, object] = await response.json()
+            data: Mapping[str, object] = JSON_CODEC.validate_json(await response.read())
 
         return data
 
-    def _map_result(
-        self, result: str
-    ) -> Literal["success", "failure", "timeout", "error"]:
+    def _map_result(self, result: str) -> TestStatus:
         """Map Bitbucket result to test status."""
-        mapping: dict[str, Literal["success", "failure", "timeout", "error"]] = {
-            "SUCCESSFUL": "success",
-            "FAILED": "failure",
-            "ERROR": "error",
-            "STOPPED": "error",
-        }
-        return mapping.get(result, "error")
+        return _RESULT_MAP.get(result, "error")
@@ -1,17 +1,32 @@
 """GitHub Actions provider implementation."""
 
 import asyncio
+import itertools
 import json
+import random
 import time
 from collections.abc import Mapping
-from typing import Literal
-
-import aiohttp
+from datetime import UTC, datetime
 
 from boostsec.registry_test_action.models.provider_config import GitHubConfig
 from boostsec.registry_test_action.models.test_definition import Test
-from boostsec.registry_test_action.models.test_result import TestResult
-from boostsec.registry_test_action.providers.base import PipelineProvider
+from boostsec.registry_test_action.models.test_result import TestResult, TestStatus
+from boostsec.registry_test_action.providers.base import JSON_CODEC, PipelineProvider
+
+_CONCLUSION_MAP: dict[str, TestStatus] = {
+    "success": "success",
+    "failure": "failure",
+    "cancelled": "error",
+    "timed_out": "timeout",
+    "action_required": "error",
+    "neutral": "success",
+    "skipped": "error",
+    "stale": "error",
+}
+
+# Kept below the first retry delay of _find_workflow_run, so each lookup of a
+# given dispatch sees a listing fetched after its previous one.
+_RECENT_RUNS_TTL = 1.0
 
 
 class GitHubProvider(PipelineProvider):
@@ -21,6 +36,21 @@ class GitHubProvider(PipelineProvider):
         """Initialize GitHub provider with configuration."""
         self.config = config
         self.base_url = config.base_url
+        repo_url = f"{self.base_url}/repos/{config.owner}/{config.repo}"
+        self._dispatch_url = (
+            f"{repo_url}/actions/workflows/{config.workflow_id}/dispatches"
+        )
+        self._runs_url = f"{repo_url}/actions/runs"
+        self._dispatches: dict[str, tuple[float, str, str]] = {}
+        self._dispatch_ids = itertools.count(1)
+        self._recent_runs: tuple[float, list[object]] | None = None
+        self._recent_runs_task: asyncio.Task[list[object]] | None = None
+        self._etags: dict[str, tuple[str, Mapping[str, object]]] = {}
+        self._headers = {
+            "Authorization": f"Bearer {config.token}",
+            "Accept": "application/vnd.github+json",
+        }
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
 
     async def dispatch_test(
         self,
@@ -29,91 +59,73 @@ class GitHubProvider(PipelineProvider):
         registry_ref: str,
         registry_repo: str,
     ) -> str:
-        """Dispatch workflow and return run ID."""
+        """Dispatch workflow and return a dispatch ID for find_run.
+
+        The dispatch API does not report the run it started, so the run is
+        looked up afterwards by find_run.
+        """
         dispatch_time = time.time()
 
-        async with aiohttp.ClientSession() as session:
-            url = (
-                f"{self.base_url}/repos/{self.config.owner}/{self.config.repo}/"
-                f"actions/workflows/{self.config.workflow_id}/dispatches"
-            )
-            headers = {
-                "Authorization": f"Bearer {self.config.token}",
-                "Accept": "application/vnd.github+json",
-            }
-            inputs = {
-                "scanner_id": scanner_id,
-                "test_name": test.name,
-                "test_type": test.type,
-                "source_url": test.source.url,
-                "source_ref": test.source.ref,
-                "registry_ref": registry_ref,
-                "registry_repo": registry_repo,
-                "scan_paths": json.dumps(test.scan_paths),
-                "timeout": test.timeout,
-            }
-
-            if test.scan_configs is not None:
-                inputs["scan_configs"] = json.dumps(test.scan_configs)
-
-            payload = {
-                "ref": self.config.ref,
-                "inputs": inputs,
-            }
-
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status != 204:
-                    text = await response.text()
-                    raise RuntimeError(
-                        f"Failed to dispatch workflow: {response.status} {text}"
-                    )
-
-        await asyncio.sleep(5)
-
-        run_id = await self._find_workflow_run(dispatch_time, scanner_id, test.name)
-        return run_id
+        session = self._get_session()
+        inputs = {
+            "scanner_id": scanner_id,
+            "test_name": test.name,
+            "test_type": test.type,
+            "source_url": test.source.url,
+            "source_ref": test.source.ref,
+            "registry_ref": registry_ref,
+            "registry_repo": registry_repo,
+            "scan_paths": json.dumps(test.scan_paths),
+            "timeout": test.timeout,
+        }
+
+        if test.scan_configs is not None:
+            inputs["scan_configs"] = json.dumps(test.scan_configs)
+
+        payload = {
+            "ref": self.config.ref,
+            "inputs": inputs,
+        }
+
+        async with session.post(
+            self._dispatch_url,
+            headers=self._json_headers,
+            data=JSON_CODEC.dump_json(payload),
+        ) as response:
+            if response.status != 204:
+                text = await response.text()
+                raise RuntimeError(
+                    f"Failed to dispatch workflow: {response.status} {text}"
+                )
+
+        dispatch_id = f"dispatch-{next(self._dispatch_ids)}"
+        self._dispatches[dispatch_id] = (dispatch_time, scanner_id, test.name)
+        return dispatch_id
+
+    async def find_run(self, run_id: str) -> str:
+        """Find the workflow run started by a dispatch."""
+        dispatch_time, scanner_id, test_name = self._dispatches.pop(run_id)
+        return await self._find_workflow_run(dispatch_time, scanner_id, test_name)
 
     async def poll_status(self, run_id: str) -> tuple[bool, TestResult]:
         """Check if test run is complete and get result."""
-        async with aiohttp.ClientSession() as session:
-            url = (
-                f"{self.base_url}/repos/{self.config.owner}/{self.config.repo}/"
-                f"actions/runs/{run_id}"
-            )
-            headers = {
-                "Authorization": f"Bearer {self.config.token}",
-                "Accept": "application/vnd.github+json",
-            }
-
-            async with session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise RuntimeError(
-                        f"Failed to get workflow run: {response.status} {text}"
-                    )
-
-                data: Mapping[str, object] = await response.json()
+        url = f"{self._runs_url}/{run_id}"
+        data = await self._get_json(url, "Failed to get workflow run")
 
         status_str = data.get("status")
         conclusion_str = data.get("conclusion")
         html_url = str(data.get("html_url", ""))
 
         is_complete = status_str == "completed"
+        test_status: TestStatus = "error"
+        duration = 0.0
 
-        if not is_complete:
-            result = TestResult(
-                provider="github",
-                scanner="unknown",
-                test_name="unknown",
-                status="error",
-                duration=0.0,
-                run_url=html_url,
-            )
-            return (False, result)
-
-        # Calculate duration from workflow run timestamps
-        duration = self._calculate_duration(data)
-        test_status = self._map_conclusion(str(conclusion_str))
+        if is_complete:
+            # The run will not change anymore, so stop revalidating it
+            self._etags.pop(url, None)
+            # Calculate duration from workflow run timestamps
+            duration = self._calculate_duration(data)
+            test_status = self._map_conclusion(str(conclusion_str))
 
         result = TestResult(
             provider="github",
@@ -124,15 +136,20 @@ class GitHubProvider(PipelineProvider):
             run_url=html_url,
         )
 
-        return (True, result)
+        return (is_complete, result)
 
     async def _find_workflow_run(
         self, dispatch_time: float, scanner_id: str, test_name: str
     ) -> str:
         """Find the workflow run that was just dispatched.
 
-        Matches runs by time window and scanner_id in display_title.
+        Matches runs by time window and scanner_id in display_title. The delay
+        between lookups starts short, so runs registered quickly are found
+        quickly, and grows exponentially to limit requests when GitHub is slow.
+        A small random jitter keeps concurrent dispatches from listing runs in
+        lockstep.
         """
+        delay = 1.0
         for attempt in range(10):
             runs = await self._fetch_recent_runs()
             run_id = self._find_matching_run(runs, dispatch_time, scanner_id, test_name)
@@ -141,35 +158,82 @@ class GitHubProvider(PipelineProvider):
                 return run_id
 
             if attempt < 9:
-                await asyncio.sleep(2)
+                jitter = random.uniform(0, delay * 0.1)  # noqa: S311
+                await asyncio.sleep(delay + jitter)
+                delay = min(delay * 1.5, 8.0)
 
         raise RuntimeError("Could not find dispatched workflow run")
 
     async def _fetch_recent_runs(self) -> list[object]:
-        """Fetch recent workflow runs."""
-        async with aiohttp.ClientSession() as session:
-            url = (
-                f"{self.base_url}/repos/{self.config.owner}/{self.config.repo}/"
-                "actions/runs"
-            )
-            headers = {
-                "Authorization": f"Bearer {self.config.token}",
-                "Accept": "application/vnd.github+json",
-            }
-            params = {"per_page": "5"}
-
-            async with session.get(url, headers=headers, params=params) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise RuntimeError(
-                        f"Failed to list workflow runs: {response.status} {text}"
-                    )
-
-                data: Mapping[str, object] = await response.json()
+        """Fetch recent workflow runs.
+
+        Concurrent dispatches looking for their runs share a single in-flight
+        request instead of each listing the same runs, and a listing is reused
+        for a short while after it was fetched.
+        """
+        if self._recent_runs is not None:
+            fetched_at, runs = self._recent_runs
+            if time.monotonic() - fetched_at < _RECENT_RUNS_TTL:
+                return runs
+
+        task = self._recent_runs_task
+        if task is None:
+            task = asyncio.create_task(self._request_recent_runs())
+            task.add_done_callback(self._clear_recent_runs_task)
+            self._recent_runs_task = task
+        return await asyncio.shield(task)
+
+    def _clear_recent_runs_task(self, task: asyncio.Task[list[object]]) -> None:
+        """Cache a finished recent runs request and forget the task."""
+        if self._recent_runs_task is task:
+            self._recent_runs_task = None
+        if not task.cancelled() and task.exception() is None:
+            self._recent_runs = (time.monotonic(), task.result())
+
+    async def _request_recent_runs(self) -> list[object]:
+        """Request the most recent workflow runs from the API."""
+        data = await self._get_json(
+            f"{self._runs_url}?per_page=30", "Failed to list workflow runs"
+        )
 
         runs = data.get("workflow_runs", [])
         return runs if isinstance(runs, list) else []
 
+    async def _get_json(self, url: str, error: str) -> Mapping[str, object]:
+        """GET a JSON resource, revalidating it with its ETag if fetched before.
+
+        GitHub answers an unchanged resource with 304 Not Modified, which does
+        not count against the rate limit, and the cached body is reused.
+
+        Args:
+            url: URL to fetch
+            error: Message prefix of the RuntimeError raised on failure
+
+        Returns:
+            Decoded JSON body
+
+        """
+        session = self._get_session()
+        cached = self._etags.get(url)
+        headers = self._headers
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached is not None:
+                return cached[1]
+
+            if response.status != 200:
+                text = await response.text()
+                raise RuntimeError(f"{error}: {response.status} {text}")
+
+            data: Mapping[str, object] = JSON_CODEC.validate_json(await response.read())
+            etag = response.headers.get("ETag")
+
+        if etag:
+            self._etags[url] = (etag, data)
+        return data
+
     def _is_matching_run(self, run: object, scanner_id: str, test_name: str) -> bool:
         """Check if run matches scanner_id and test_name in display_title."""
         if not isinstance(run, dict):
@@ -200,7 +264,11 @@ class GitHubProvider(PipelineProvider):
         2. Scanner ID in display_title
         3. Test name in display_title (for additional precision)
         """
-        from datetime import datetime
+        # GitHub timestamps are fixed-width UTC ISO-8601 strings, so comparing
+        # them as strings is the same as comparing the times they denote.
+        earliest = datetime.fromtimestamp(dispatch_time - 60, UTC).strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        )
 
         for run in runs:
             if not self._is_matching_run(run, scanner_id, test_name):
@@ -212,14 +280,13 @@ class GitHubProvider(PipelineProvider):
             if not isinstance(created_at, str):
                 continue
 
-            created_time = datetime.fromisoformat(
-                created_at.replace("Z", "+00:00")
-            ).timestamp()
+            # Runs are listed newest first, so every later run is older still.
+            if created_at < earliest:
+                return None
 
-            if created_time >= dispatch_time - 60:
-                run_id = run.get("id")  # type: ignore[attr-defined]
-                if isinstance(run_id, int):
-                    return str(run_id)
+            run_id = run.get("id")  # type: ignore[attr-defined]
+            if isinstance(run_id, int):
+                return str(run_id)
 
         return None
 
@@ -233,8 +300,6 @@ class GitHubProvider(PipelineProvider):
             Duration in seconds, or 0.0 if timestamps unavailable
 
         """
-        from datetime import datetime
-
         created_at = data.get("created_at")
         updated_at = data.get("updated_at")
 
@@ -242,25 +307,13 @@ class GitHubProvider(PipelineProvider):
             return 0.0
 
         try:
-            created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-            updated = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
+            created = datetime.fromisoformat(created_at)
+            updated = datetime.fromisoformat(updated_at)
             duration = (updated - created).total_seconds()
             return max(0.0, duration)  # Ensure non-negative
         except (ValueError, AttributeError):
             return 0.0
 
-    def _map_conclusion(
-        self, conclusion: str
-    ) -> Literal["success", "failure", "timeout", "error"]:
+    def _map_conclusion(self, conclusion: str) -> TestStatus:
         """Map GitHub conclusion to test status."""
-        mapping: dict[str, Literal["success", "failure", "timeout", "error"]] = {
-            "success": "success",
-            "failure": "failure",
-            "cancelled": "error",
-            "timed_out": "timeout",
-            "action_required": "error",
-            "neutral": "success",
-            "skipped": "error",
-            "stale": "error",
-        }
-        return mapping.get(conclusion, "error")
+        return _CONCLUSION_MAP.get(conclusion, "error")
@@ -2,15 +2,20 @@
 
 import json
 from collections.abc import Mapping
-from typing import Literal
 from urllib.parse import quote
 
-import aiohttp
-
 from boostsec.registry_test_action.models.provider_config import GitLabConfig
 from boostsec.registry_test_action.models.test_definition import Test
-from boostsec.registry_test_action.models.test_result import TestResult
-from boostsec.registry_test_action.providers.base import PipelineProvider
+from boostsec.registry_test_action.models.test_result import TestResult, TestStatus
+from boostsec.registry_test_action.providers.base import JSON_CODEC, PipelineProvider
+
+_STATUS_MAP: dict[str, TestStatus] = {
+    "success": "success",
+    "failed": "failure",
+    "canceled": "error",
+    "skipped": "error",
+    "manual": "error",
+}
 
 
 class GitLabProvider(PipelineProvider):
@@ -24,6 +29,11 @@ class GitLabProvider(PipelineProvider):
         self._pipeline_context: dict[str, tuple[str, str]] = {}
         # URL-encode project_id to support both numeric IDs and paths
         self._encoded_project_id = quote(str(config.project_id), safe="")
+        project_url = f"{self.base_url}/projects/{self._encoded_project_id}"
+        self._pipeline_url = f"{project_url}/pipeline"
+        self._pipelines_url_prefix = f"{project_url}/pipelines/"
+        self._headers = {"PRIVATE-TOKEN": config.token}
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
 
     async def dispatch_test(
         self,
@@ -33,43 +43,44 @@ class GitLabProvider(PipelineProvider):
         registry_repo: str,
     ) -> str:
         """Dispatch pipeline using project access token and return pipeline ID."""
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/projects/{self._encoded_project_id}/pipeline"
-            headers = {
-                "PRIVATE-TOKEN": self.config.token,
-                "Content-Type": "application/json",
-            }
-
-            # Build variables list
-            variables = [
-                ("SCANNER_ID", scanner_id),
-                ("TEST_NAME", test.name),
-                ("TEST_TYPE", test.type),
-                ("SOURCE_URL", test.source.url),
-                ("SOURCE_REF", test.source.ref),
-                ("REGISTRY_REF", registry_ref),
-                ("REGISTRY_REPO", registry_repo),
-                ("SCAN_PATHS", json.dumps(test.scan_paths)),
-                ("TIMEOUT", test.timeout),
-            ]
-
-            if test.scan_configs is not None:
-                variables.append(("SCAN_CONFIGS", json.dumps(test.scan_configs)))
-
-            # Format as JSON payload
-            payload = {
-                "ref": self.config.ref,
-                "variables": [{"key": key, "value": value} for key, value in variables],
-            }
-
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status != 201:
-                    text = await response.text()
-                    raise RuntimeError(
-                        f"Failed to create pipeline: {response.status} {text}"
-                    )
-
-                response_data: Mapping[str, object] = await response.json()
+        session = self._get_session()
+
+        # Build variables list
+        variables = [
+            ("SCANNER_ID", scanner_id),
+            ("TEST_NAME", test.name),
+            ("TEST_TYPE", test.type),
+            ("SOURCE_URL", test.source.url),
+            ("SOURCE_REF", test.source.ref),
+            ("REGISTRY_REF", registry_ref),
+            ("REGISTRY_REPO", registry_repo),
+            ("SCAN_PATHS", json.dumps(test.scan_paths)),
+            ("TIMEOUT", test.timeout),
+        ]
+
+        if test.scan_configs is not None:
+            variables.append(("SCAN_CONFIGS", json.dumps(test.scan_configs)))
+
+        # Format as JSON payload
+        payload = {
+            "ref": self.config.ref,
+            "variables": [{"key": key, "value": value} for key, value in variables],
+        }
+
+        async with session.post(
+            self._pipeline_url,
+            headers=self._json_headers,
+            data=JSON_CODEC.dump_json(payload),
+        ) as response:
+            if response.status != 201:
+                text = await response.text()
+                raise RuntimeError(
+                    f"Failed to create pipeline: {response.status} {text}"
+                )
+
+            response_data: Mapping[str, object] = JSON_CODEC.validate_json(
+                await response.read()
+            )
 
         pipeline_id = response_data.get("id")
         if not isinstance(pipeline_id, int):
@@ -87,23 +98,15 @@ class GitLabProvider(PipelineProvider):
         # Retrieve stored test context
         scanner, test_name = self._pipeline_context.get(run_id, ("unknown", "unknown"))
 
-        async with aiohttp.ClientSession() as session:
-            url = (
-                f"{self.base_url}/projects/{self._encoded_project_id}/"
-                f"pipelines/{run_id}"
-            )
-            headers = {
-                "PRIVATE-TOKEN": self.config.token,
-            }
+        session = self._get_session()
+        url = f"{self._pipelines_url_prefix}{run_id}"
 
-            async with session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise RuntimeError(
-                        f"Failed to get pipeline: {response.status} {text}"
-                    )
+        async with session.get(url, headers=self._headers) as response:
+            if response.status != 200:
+                text = await response.text()
+                raise RuntimeError(f"Failed to get pipeline: {response.status} {text}")
 
-                data: Mapping[str, object] = await response.json()
+            data: Mapping[str, object] = JSON_CODEC.validate_json(await response.read())
 
         status_str = data.get("status")
         web_url = str(data.get("web_url", ""))
@@ -116,18 +119,11 @@ class GitLabProvider(PipelineProvider):
             "manual",
         }
 
-        if not is_complete:
-            result = TestResult(
-                provider="gitlab",
-                scanner=scanner,
-                test_name=test_name,
-                status="error",
-                duration=0.0,
-                run_url=web_url,
-            )
-            return (False, result)
-
-        test_status = self._map_status(str(status_str))
+        test_status: TestStatus = "error"
+        if is_complete:
+            # Pipeline completed, its context is no longer needed
+            self._pipeline_context.pop(run_id, None)
+            test_status = self._map_status(str(status_str))
 
         result = TestResult(
             provider="gitlab",
@@ -138,17 +134,8 @@ class GitLabProvider(PipelineProvider):
             run_url=web_url,
         )
 
-        return (True, result)
+        return (is_complete, result)
 
-    def _map_status(
-        self, status: str
-    ) -> Literal["success", "failure", "timeout", "error"]:
+    def _map_status(self, status: str) -> TestStatus:
         """Map GitLab status to test status."""
-        mapping: dict[str, Literal["success", "failure", "timeout", "error"]] = {
-            "success": "success",
-            "failed": "failure",
-            "canceled": "error",
-            "skipped": "error",
-            "manual": "error",
-        }
-        return mapping.get(status, "error")
+        return _STATUS_MAP.get(status, "error")
@@ -2,8 +2,11 @@
 
 import asyncio
 import logging
+import os
+from collections import defaultdict
 from collections.abc import Sequence
 from pathlib import Path
+from typing import cast
 
 logger = logging.getLogger(__name__)
 
@@ -35,14 +38,15 @@ async def detect_changed_scanners(
     await _log_git_status(registry_path, base_ref, head_ref)
 
     changed_files = await _get_changed_files(registry_path, base_ref, head_ref)
-    logger.info(f"Found {len(changed_files)} changed files")
+    logger.info(f"Found {len(changed_files)} changed scanner files")
 
     scanner_paths = _extract_scanner_paths(changed_files)
     logger.info(f"Extracted {len(scanner_paths)} scanner paths: {scanner_paths}")
 
+    existing = _find_scanners_with_tests(registry_path, scanner_paths)
     scanners_with_tests = []
     for scanner_path in scanner_paths:
-        if await has_test_definition(registry_path, scanner_path):
+        if scanner_path in existing:
             logger.info(f"Scanner {scanner_path} has tests.yaml")
             scanners_with_tests.append(scanner_path)
         else:
@@ -52,7 +56,7 @@ async def detect_changed_scanners(
     return scanners_with_tests
 
 
-async def has_test_definition(registry_path: Path, scanner_id: str) -> bool:
+def has_test_definition(registry_path: Path, scanner_id: str) -> bool:
     """Check if scanner has a tests.yaml file.
 
     Args:
@@ -63,8 +67,50 @@ async def has_test_definition(registry_path: Path, scanner_id: str) -> bool:
         True if tests.yaml exists, False otherwise
 
     """
-    test_file = registry_path / "scanners" / scanner_id / "tests.yaml"
-    return test_file.exists()
+    # Plain string paths: this runs once per changed scanner, and building a
+    # Path for each one costs more than the stat itself.
+    return os.path.exists(
+        os.path.join(registry_path, "scanners", scanner_id, "tests.yaml")
+    )
+
+
+def _find_scanners_with_tests(
+    registry_path: Path, scanner_paths: Sequence[str]
+) -> set[str]:
+    """Find which scanners have a tests.yaml file.
+
+    Each organization directory is listed once, so scanners removed by the
+    change are ruled out without a stat call, and only the remaining ones are
+    checked for a tests.yaml.
+
+    Args:
+        registry_path: Path to the scanner registry repository
+        scanner_paths: Scanner identifiers (e.g., ["boostsecurityio/trivy-fs"])
+
+    Returns:
+        Set of the given scanner identifiers that have a tests.yaml file
+
+    """
+    by_org: defaultdict[str, set[str]] = defaultdict(set)
+    for scanner_path in scanner_paths:
+        org, name = scanner_path.split("/", 1)
+        by_org[org].add(name)
+
+    found: set[str] = set()
+    for org, names in by_org.items():
+        try:
+            with os.scandir(registry_path / "scanners" / org) as entries:
+                existing = [e.name for e in entries if e.name in names and e.is_dir()]
+        except OSError:
+            # Missing, not a directory, or unreadable: no scanners to test there
+            continue
+
+        for name in existing:
+            scanner_id = f"{org}/{name}"
+            if has_test_definition(registry_path, scanner_id):
+                found.add(scanner_id)
+
+    return found
 
 
 async def _log_git_status(  # pragma: no cover
@@ -139,10 +185,49 @@ async def _resolve_ref(registry_path: Path, ref: str) -> str:
     )
 
 
+async def _resolve_refs(registry_path: Path, *refs: str) -> list[str]:
+    """Resolve several git references, spawning a single git process if possible.
+
+    All references are first verified with one ``git rev-parse --revs-only``
+    call. If any of them does not exist as-is, each reference is resolved
+    individually with ``_resolve_ref`` so the origin/ fallback still applies.
+
+    Args:
+        registry_path: Path to the git repository
+        refs: Git references to resolve
+
+    Returns:
+        Resolved git references, in the same order as given
+
+    Raises:
+        RuntimeError: If a reference cannot be resolved
+
+    """
+    process = await asyncio.create_subprocess_exec(
+        "git",
+        "rev-parse",
+        "--revs-only",
+        *refs,
+        cwd=registry_path,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, _ = await process.communicate()
+
+    # --revs-only silently drops arguments that are not valid revisions
+    resolved = stdout.decode().split()
+    if process.returncode == 0 and len(resolved) == len(refs):
+        for ref, sha in zip(refs, resolved, strict=True):
+            logger.info(f"Resolved ref '{ref}' to {sha}")
+        return list(refs)
+
+    return [await _resolve_ref(registry_path, ref) for ref in refs]
+
+
 async def _get_changed_files(
     registry_path: Path, base_ref: str, head_ref: str
 ) -> list[str]:
-    """Get list of changed files between two git refs.
+    """Get list of changed scanner files between two git refs.
 
     Args:
         registry_path: Path to the git repository
@@ -150,27 +235,44 @@ async def _get_changed_files(
         head_ref: Head git reference
 
     Returns:
-        List of changed file paths relative to repository root
+        List of changed file paths under scanners/, relative to repository root
 
     """
     # Resolve refs (they might need origin/ prefix in CI)
-    resolved_base = await _resolve_ref(registry_path, base_ref)
-    resolved_head = await _resolve_ref(registry_path, head_ref)
+    resolved_base, resolved_head = await _resolve_refs(
+        registry_path, base_ref, head_ref
+    )
 
-    logger.info(f"Running: git diff --name-only {resolved_base} {resolved_head}")
+    logger.info(
+        f"Running: git diff --name-only -z {resolved_base} {resolved_head} -- scanners/"
+    )
 
     process = await asyncio.create_subprocess_exec(
         "git",
         "diff",
         "--name-only",
+        "-z",
         resolved_base,
         resolved_head,
+        "--",
+        "scanners/",
         cwd=registry_path,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
     )
+    stdout = cast(asyncio.StreamReader, process.stdout)
 
-    stdout, stderr = await process.communicate()
+    # The pathspec limits the diff to scanners/ in git itself; paths are
+    # NUL-terminated and unquoted with -z.
+    files = []
+    while True:
+        try:
+            record = await stdout.readuntil(b"\0")
+        except asyncio.IncompleteReadError:
+            break
+        files.append(record[:-1].decode())
+
+    _, stderr = await process.communicate()
 
     if process.returncode != 0:
         error_msg = stderr.decode().strip()
@@ -178,8 +280,7 @@ async def _get_changed_files(
         logger.error(f"Git stderr: {error_msg}")
         raise RuntimeError(f"Git command failed: {error_msg}")
 
-    files = stdout.decode().strip().split("\n")
-    return [f for f in files if f]
+    return files
 
 
 def _extract_scanner_paths(changed_files: Sequence[str]) -> list[str]:
@@ -192,13 +293,14 @@ def _extract_scanner_paths(changed_files: Sequence[str]) -> list[str]:
         List of unique scanner identifiers (e.g., ["org/scanner"])
 
     """
-    scanner_paths = set()
+    scanner_paths: set[str] = set()
 
     for file_path in changed_files:
         if not file_path.startswith("scanners/"):
             continue
 
-        parts = Path(file_path).parts
+        # Git always reports paths with forward slashes
+        parts = file_path.split("/", 3)
         if len(parts) < 4:
             continue
 
@@ -1,5 +1,6 @@
 """Load and parse test definitions from YAML files."""
 
+import asyncio
 import logging
 from pathlib import Path
 
@@ -7,6 +8,11 @@ import yaml
 
 from boostsec.registry_test_action.models.test_definition import TestDefinition
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,14 +31,26 @@ async def load_test_definition(registry_path: Path, scanner_id: str) -> TestDefi
         ValueError: If YAML is invalid or doesn't match schema
 
     """
+    logger.info(f"Loading test definition for scanner: {scanner_id}")
     test_file = registry_path / "scanners" / scanner_id / "tests.yaml"
+    definition = await asyncio.to_thread(_parse_test_file, test_file)
+    logger.info(f"Successfully loaded test definition for {scanner_id}")
+    return definition
+
 
-    if not test_file.exists():
-        raise FileNotFoundError(f"Test file not found: {test_file}")
+def _parse_test_file(test_file: Path) -> TestDefinition:
+    """Read, parse and validate a tests.yaml file.
 
+    Runs in a worker thread so file reads and YAML parsing don't block the
+    event loop.
+    """
     try:
-        with test_file.open() as f:
-            data = yaml.safe_load(f)
+        content = test_file.read_bytes()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Test file not found: {test_file}") from e
+
+    try:
+        data = yaml.load(content, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in {test_file}: {e}") from e
 
@@ -48,7 +66,7 @@ async def load_test_definition(registry_path: Path, scanner_id: str) -> TestDefi
 async def load_all_tests(
     registry_path: Path, scanner_ids: list[str]
 ) -> dict[str, TestDefinition]:
-    """Load test definitions for multiple scanners.
+    """Load test definitions for multiple scanners concurrently.
 
     Args:
         registry_path: Path to the scanner registry repository
@@ -62,12 +80,19 @@ async def load_all_tests(
         ValueError: If a test file is invalid
 
     """
-    results: dict[str, TestDefinition] = {}
-
-    for scanner_id in scanner_ids:
-        logger.info(f"Loading test definition for scanner: {scanner_id}")
-        definition = await load_test_definition(registry_path, scanner_id)
-        logger.info(f"Successfully loaded test definition for {scanner_id}")
-        results[scanner_id] = definition
-
-    return results
+    outcomes = await asyncio.gather(
+        *(
+            load_test_definition(registry_path, scanner_id)
+            for scanner_id in scanner_ids
+        ),
+        return_exceptions=True,
+    )
+
+    definitions: dict[str, TestDefinition] = {}
+    for scanner_id, outcome in zip(scanner_ids, outcomes, strict=True):
+        # Report the first failing scanner in input order, not whichever load
+        # happened to fail first.
+        if isinstance(outcome, BaseException):
+            raise outcome
+        definitions[scanner_id] = outcome
+    return definitions
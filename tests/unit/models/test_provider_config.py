@@ -122,3 +122,15 @@ def test_bitbucket_config_missing_fields() -> None:
         BitbucketConfig(username="user", api_token="token")  # type: ignore[call-arg]
     assert "workspace" in str(exc_info.value)
     assert "repo_slug" in str(exc_info.value)
+
+
+def test_github_config_is_frozen() -> None:
+    """GitHubConfig rejects mutation after validation."""
+    config = GitHubConfig(
+        token="ghp_token123",
+        owner="boostsecurityio",
+        repo="test-repo",
+        workflow_id="test.yml",
+    )
+    with pytest.raises(ValidationError, match="frozen"):
+        config.base_url = "http://localhost:8080"  # type: ignore[misc]
@@ -1,5 +1,7 @@
 """Tests for Azure DevOps Pipelines provider."""
 
+import json
+
 import pytest
 from aioresponses import aioresponses
 
@@ -59,8 +61,14 @@ async def test_dispatch_test_success(
             "main",
             "test/registry",
         )
+        ((request,),) = m.requests.values()
 
     assert run_id == "999"
+    params = json.loads(request.kwargs["data"])["templateParameters"]
+    assert params["SCANNER_ID"] == "boostsecurityio/trivy-fs"
+    assert params["SCAN_PATHS"] == '["."]'
+
+    await provider.aclose()
 
 
 async def test_dispatch_test_with_scan_configs(azure_config: AzureDevOpsConfig) -> None:
@@ -101,6 +109,8 @@ async def test_dispatch_test_with_scan_configs(azure_config: AzureDevOpsConfig)
 
     assert run_id == "999"
 
+    await provider.aclose()
+
 
 async def test_dispatch_test_failure(
     azure_config: AzureDevOpsConfig, test_definition: Test
@@ -125,6 +135,8 @@ async def test_dispatch_test_failure(
                 "test/registry",
             )
 
+    await provider.aclose()
+
 
 async def test_dispatch_test_missing_run_id(
     azure_config: AzureDevOpsConfig, test_definition: Test
@@ -149,6 +161,8 @@ async def test_dispatch_test_missing_run_id(
                 "test/registry",
             )
 
+    await provider.aclose()
+
 
 async def test_poll_status_in_progress(azure_config: AzureDevOpsConfig) -> None:
     """poll_status returns not complete when pipeline is in progress."""
@@ -173,6 +187,8 @@ async def test_poll_status_in_progress(azure_config: AzureDevOpsConfig) -> None:
     assert result.provider == "azure"
     assert result.status == "error"
 
+    await provider.aclose()
+
 
 async def test_poll_status_completed_success(azure_config: AzureDevOpsConfig) -> None:
     """poll_status returns complete with success status."""
@@ -198,6 +214,8 @@ async def test_poll_status_completed_success(azure_config: AzureDevOpsConfig) ->
     assert result.status == "success"
     assert result.provider == "azure"
 
+    await provider.aclose()
+
 
 async def test_poll_status_completed_failure(azure_config: AzureDevOpsConfig) -> None:
     """poll_status returns complete with failure status."""
@@ -222,6 +240,8 @@ async def test_poll_status_completed_failure(azure_config: AzureDevOpsConfig) ->
     assert is_complete is True
     assert result.status == "failure"
 
+    await provider.aclose()
+
 
 async def test_poll_status_api_error(azure_config: AzureDevOpsConfig) -> None:
     """poll_status raises RuntimeError on API failure."""
@@ -239,6 +259,8 @@ async def test_poll_status_api_error(azure_config: AzureDevOpsConfig) -> None:
         with pytest.raises(RuntimeError, match="Failed to get pipeline run"):
             await provider.poll_status("999")
 
+    await provider.aclose()
+
 
 async def test_map_result_all_statuses(azure_config: AzureDevOpsConfig) -> None:
     """_map_result handles all Azure DevOps result types."""
@@ -271,6 +293,8 @@ async def test_poll_status_no_links(azure_config: AzureDevOpsConfig) -> None:
     assert is_complete is True
     assert result.run_url == ""
 
+    await provider.aclose()
+
 
 async def test_poll_status_invalid_links(azure_config: AzureDevOpsConfig) -> None:
     """poll_status handles invalid _links structure gracefully."""
@@ -292,3 +316,5 @@ async def test_poll_status_invalid_links(azure_config: AzureDevOpsConfig) -> Non
 
     assert is_complete is True
     assert result.run_url == ""
+
+    await provider.aclose()
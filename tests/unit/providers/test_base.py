@@ -1,12 +1,20 @@
 """Tests for base pipeline provider."""
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from boostsec.registry_test_action.models.test_definition import Test
 from boostsec.registry_test_action.models.test_result import TestResult
-from boostsec.registry_test_action.providers.base import PipelineProvider
+from boostsec.registry_test_action.providers.base import (
+    PipelineProvider,
+    _rate_limit_delay,
+    _retry_rate_limited,
+)
 
 
 class TestPipelineProvider(PipelineProvider):
@@ -99,6 +107,17 @@ async def test_wait_for_completion_timeout() -> None:
         await provider.wait_for_completion("run123", timeout=1, poll_interval=0.5)
 
 
+async def test_wait_for_completion_poll_timeout_propagates() -> None:
+    """A TimeoutError from polling is not reported as the run timing out."""
+    provider = TestPipelineProvider()
+    provider.poll_status_mock.side_effect = TimeoutError("request timed out")
+
+    with pytest.raises(TimeoutError, match="request timed out"):
+        await provider.wait_for_completion("run123", timeout=1800)
+
+    await provider.aclose()
+
+
 async def test_wait_for_completion_custom_timeout() -> None:
     """wait_for_completion respects custom timeout."""
     provider = TestPipelineProvider()
@@ -127,3 +146,383 @@ async def test_wait_for_completion_custom_timeout() -> None:
 
     assert final_result == result
     assert call_count == 3
+
+
+async def test_get_session_reused_until_closed() -> None:
+    """_get_session returns the same session until aclose is called."""
+    provider = TestPipelineProvider()
+
+    session = provider._get_session()
+    assert provider._get_session() is session
+
+    await provider.aclose()
+    assert session.closed
+
+    new_session = provider._get_session()
+    assert new_session is not session
+    await provider.aclose()
+
+
+async def test_get_session_settings() -> None:
+    """_get_session tunes the connection pool and request timeout."""
+    provider = TestPipelineProvider()
+
+    session = provider._get_session()
+
+    assert session.timeout.total is None
+    assert session.timeout.connect == 10
+    assert session.timeout.sock_read == 30
+    assert session.connector is not None
+    assert session.connector.limit == 50
+    assert session.connector.limit_per_host == 20
+    assert session._middlewares == (_retry_rate_limited,)
+    await provider.aclose()
+
+
+def _response(status: int, headers: dict[str, str] | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status = status
+    response.headers = headers or {}
+    return response
+
+
+@pytest.mark.parametrize(
+    ("status", "headers", "expected"),
+    [
+        (200, {}, None),
+        (403, {}, None),
+        (429, {}, 1.0),
+        (429, {"Retry-After": "5"}, 5.0),
+        (403, {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}, 1.0),
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1010"}, 10.0),
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "990"}, 0.0),
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4600"}, None),
+        (429, {"Retry-After": "3600"}, None),
+    ],
+)
+def test_rate_limit_delay(
+    status: int, headers: dict[str, str], expected: float | None
+) -> None:
+    """_rate_limit_delay honors Retry-After and GitHub's rate limit reset."""
+    with patch("time.time", return_value=1000.0):
+        assert _rate_limit_delay(_response(status, headers)) == expected
+
+
+async def test_retry_rate_limited_waits_and_retries() -> None:
+    """Rate-limited requests are retried after the advertised delay."""
+    limited = _response(429, {"Retry-After": "2"})
+    ok = _response(200)
+    handler = AsyncMock(side_effect=[limited, ok])
+
+    with patch("asyncio.sleep") as mock_sleep:
+        response = await _retry_rate_limited(MagicMock(), handler)
+
+    assert response is ok
+    limited.release.assert_called_once()
+    mock_sleep.assert_awaited_once_with(2.0)
+
+
+async def test_rate_limited_request_retried_by_session() -> None:
+    """The provider session retries a rate-limited request on a real server.
+
+    The wait is longer than the read timeout, which must not cover the retry.
+    """
+    calls = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return web.Response(status=429, headers={"Retry-After": "0.3"})
+        return web.json_response({"body": await request.text()})
+
+    app = web.Application()
+    app.router.add_post("/", handler)
+    provider = TestPipelineProvider()
+
+    with patch(
+        "boostsec.registry_test_action.providers.base._REQUEST_TIMEOUT",
+        aiohttp.ClientTimeout(connect=1, sock_read=0.2),
+    ):
+        async with TestServer(app) as server:
+            session = provider._get_session()
+            async with session.post(server.make_url("/"), data=b"payload") as resp:
+                assert resp.status == 200
+                assert await resp.json() == {"body": "payload"}
+
+    assert calls == 2
+    await provider.aclose()
+
+
+async def test_retry_rate_limited_gives_up() -> None:
+    """Rate-limited requests are retried a bounded number of times."""
+    limited = _response(429)
+    handler = AsyncMock(return_value=limited)
+
+    with patch("asyncio.sleep"):
+        response = await _retry_rate_limited(MagicMock(), handler)
+
+    assert response is limited
+    assert handler.await_count == 4
+
+
+async def test_aclose_without_session() -> None:
+    """Closing a provider without a session is a no-op."""
+    provider = TestPipelineProvider()
+
+    await provider.aclose()
+
+    assert provider._session is None
+
+
+async def test_wait_for_completion_backs_off() -> None:
+    """wait_for_completion grows the poll delay up to max_poll_interval."""
+    provider = TestPipelineProvider()
+    result = TestResult(
+        provider="test",
+        scanner="org/scanner",
+        test_name="test1",
+        status="success",
+        duration=10.0,
+    )
+
+    provider.poll_status_mock.side_effect = [(False, result)] * 4 + [(True, result)]
+
+    with (
+        patch(
+            "boostsec.registry_test_action.providers.base._RunPoller._sleep"
+        ) as mock_sleep,
+        patch(
+            "boostsec.registry_test_action.providers.base.random.uniform",
+            return_value=0,
+        ),
+    ):
+        final_result = await provider.wait_for_completion(
+            "run123", poll_interval=2, max_poll_interval=5
+        )
+
+    assert final_result == result
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 3, 4.5, 5]
+
+
+async def test_wait_for_completion_uses_shortest_interval() -> None:
+    """The shared poller ticks at the shortest interval any waiter asked for."""
+    provider = TestPipelineProvider()
+    result = TestResult(
+        provider="test",
+        scanner="org/scanner",
+        test_name="test1",
+        status="success",
+        duration=10.0,
+    )
+    polls: list[str] = []
+
+    async def poll_status(run_id: str) -> tuple[bool, TestResult]:
+        polls.append(run_id)
+        return (polls.count(run_id) > 2, result)
+
+    provider.poll_status_mock.side_effect = poll_status
+
+    with (
+        patch(
+            "boostsec.registry_test_action.providers.base._RunPoller._sleep"
+        ) as mock_sleep,
+        patch(
+            "boostsec.registry_test_action.providers.base.random.uniform",
+            return_value=0,
+        ),
+    ):
+        await asyncio.gather(
+            provider.wait_for_completion(
+                "run1", poll_interval=10, max_poll_interval=60
+            ),
+            provider.wait_for_completion(
+                "run2", poll_interval=1, max_poll_interval=1.2
+            ),
+        )
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 1.2]
+    await provider.aclose()
+
+
+async def test_wait_for_completion_new_run_wakes_poller() -> None:
+    """A run registered while the poller sleeps is polled right away."""
+    provider = TestPipelineProvider()
+    result = TestResult(
+        provider="test",
+        scanner="org/scanner",
+        test_name="test1",
+        status="success",
+        duration=10.0,
+    )
+    first_poll = asyncio.Event()
+    run2_polled = asyncio.Event()
+
+    async def poll_status(run_id: str) -> tuple[bool, TestResult]:
+        first_poll.set()
+        if run_id == "run2":
+            run2_polled.set()
+        # Let the other polls of the tick run, so run1 completes alongside run2
+        await asyncio.sleep(0)
+        return (run2_polled.is_set(), result)
+
+    provider.poll_status_mock.side_effect = poll_status
+
+    async def join_later() -> TestResult:
+        await first_poll.wait()
+        return await provider.wait_for_completion(
+            "run2", poll_interval=60, max_poll_interval=60
+        )
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            provider.wait_for_completion(
+                "run1", poll_interval=60, max_poll_interval=60
+            ),
+            join_later(),
+        ),
+        timeout=1,
+    )
+
+    assert list(results) == [result, result]
+    await provider.aclose()
+
+
+async def test_wait_for_completion_shares_polling() -> None:
+    """Concurrent waits are polled together by a single tick."""
+    provider = TestPipelineProvider()
+    result = TestResult(
+        provider="test",
+        scanner="org/scanner",
+        test_name="test1",
+        status="success",
+        duration=10.0,
+    )
+    provider.poll_status_mock.return_value = (True, result)
+
+    results = await asyncio.gather(
+        provider.wait_for_completion("run1"),
+        provider.wait_for_completion("run2"),
+    )
+
+    assert list(results) == [result, result]
+    assert provider.poll_status_mock.call_count == 2
+    await provider.aclose()
+
+
+async def test_wait_for_completion_poll_error() -> None:
+    """wait_for_completion raises the error from polling its run."""
+    provider = TestPipelineProvider()
+    provider.poll_status_mock.side_effect = RuntimeError("API down")
+
+    with pytest.raises(RuntimeError, match="API down"):
+        await provider.wait_for_completion("run123")
+
+    await provider.aclose()
+
+
+async def test_wait_for_completion_new_run_resets_backoff() -> None:
+    """A run joining the shared poller is polled at the initial interval."""
+    provider = TestPipelineProvider()
+    result = TestResult(
+        provider="test",
+        scanner="org/scanner",
+        test_name="test1",
+        status="success",
+        duration=10.0,
+    )
+    polls: list[str] = []
+    joined = asyncio.Event()
+
+    async def poll_status(run_id: str) -> tuple[bool, TestResult]:
+        polls.append(run_id)
+        if run_id == "run1" and polls.count("run1") == 2:
+            joined.set()
+        return (run_id == "run2" or polls.count("run1") > 3, result)
+
+    provider.poll_status_mock.side_effect = poll_status
+
+    async def join_later() -> TestResult:
+        await joined.wait()
+        return await provider.wait_for_completion(
+            "run2", poll_interval=0.01, max_poll_interval=0.02
+        )
+
+    results = await asyncio.gather(
+        provider.wait_for_completion(
+            "run1", poll_interval=0.01, max_poll_interval=0.02
+        ),
+        join_later(),
+    )
+
+    assert list(results) == [result, result]
+    assert "run2" in polls
+    await provider.aclose()
+
+
+async def test_aclose_stops_poller() -> None:
+    """Closing a provider cancels its background poller."""
+    provider = TestPipelineProvider()
+    result = TestResult(
+        provider="test",
+        scanner="org/scanner",
+        test_name="test1",
+        status="success",
+        duration=10.0,
+    )
+    provider.poll_status_mock.return_value = (False, result)
+
+    with pytest.raises(TimeoutError):
+        await provider.wait_for_completion("run123", timeout=0.01, poll_interval=1)
+
+    await provider.aclose()
+
+    assert provider._poller is None
+
+
+async def test_poller_ignores_runs_no_longer_awaited() -> None:
+    """A poll finishing after its run timed out does not resolve anything."""
+    provider = TestPipelineProvider()
+    result = TestResult(
+        provider="test",
+        scanner="org/scanner",
+        test_name="test1",
+        status="success",
+        duration=10.0,
+    )
+
+    async def poll_status(run_id: str) -> tuple[bool, TestResult]:
+        await asyncio.sleep(0.05)
+        return (True, result)
+
+    provider.poll_status_mock.side_effect = poll_status
+
+    with pytest.raises(TimeoutError):
+        await provider.wait_for_completion("run123", timeout=0.01)
+
+    assert provider._poller is not None
+    assert provider._poller._task is not None
+    await provider._poller._task
+    await provider.aclose()
+
+
+async def test_wait_for_completion_same_run_polled_once() -> None:
+    """Concurrent waits on the same run share a single poll per tick."""
+    provider = TestPipelineProvider()
+    result = TestResult(
+        provider="test",
+        scanner="org/scanner",
+        test_name="test1",
+        status="success",
+        duration=10.0,
+    )
+    provider.poll_status_mock.return_value = (True, result)
+
+    results = await asyncio.gather(
+        provider.wait_for_completion("run123"),
+        provider.wait_for_completion("run123"),
+    )
+
+    assert list(results) == [result, result]
+    provider.poll_status_mock.assert_called_once_with("run123")
+    await provider.aclose()
@@ -1,11 +1,16 @@
 """Tests for Bitbucket Pipelines provider."""
 
+import json
+
 import pytest
 from aioresponses import aioresponses
 
 from boostsec.registry_test_action.models.provider_config import BitbucketConfig
 from boostsec.registry_test_action.models.test_definition import Test, TestSource
-from boostsec.registry_test_action.providers.bitbucket import BitbucketProvider
+from boostsec.registry_test_action.providers.bitbucket import (
+    BitbucketProvider,
+    _PipelineContext,
+)
 
 
 @pytest.fixture
@@ -60,6 +65,8 @@ async def test_dispatch_test_success(
 
     assert pipeline_id == "abc-123-def"
 
+    await provider.aclose()
+
 
 async def test_dispatch_test_with_scan_configs(
     bitbucket_config: BitbucketConfig,
@@ -95,8 +102,14 @@ async def test_dispatch_test_with_scan_configs(
             "main",
             "test/registry",
         )
+        ((request,),) = m.requests.values()
 
     assert pipeline_id == "abc-123-def"
+    variables = json.loads(request.kwargs["data"])["variables"]
+    assert variables[0] == {"key": "SCANNER_ID", "value": "boostsecurityio/trivy-fs"}
+    assert variables[-1] == {"key": "SCAN_CONFIGS", "value": '[{"key": "value"}]'}
+
+    await provider.aclose()
 
 
 async def test_dispatch_test_failure(
@@ -121,6 +134,8 @@ async def test_dispatch_test_failure(
                 "test/registry",
             )
 
+    await provider.aclose()
+
 
 async def test_dispatch_test_missing_uuid(
     bitbucket_config: BitbucketConfig, test_definition: Test
@@ -144,6 +159,8 @@ async def test_dispatch_test_missing_uuid(
                 "test/registry",
             )
 
+    await provider.aclose()
+
 
 async def test_dispatch_test_missing_build_number(
     bitbucket_config: BitbucketConfig, test_definition: Test
@@ -177,12 +194,14 @@ async def test_dispatch_test_missing_build_number(
         "",
     )
 
+    await provider.aclose()
+
 
 async def test_poll_status_in_progress(bitbucket_config: BitbucketConfig) -> None:
     """poll_status returns not complete when pipeline is in progress."""
     provider = BitbucketProvider(bitbucket_config)
     # Manually populate context as if dispatch_test was called
-    provider._pipeline_context["abc-123"] = (
+    provider._pipeline_context["abc-123"] = _PipelineContext(
         "scanner1",
         "test1",
         "https://bitbucket.org/test-workspace/test-repo/pipelines/results/17",
@@ -210,12 +229,14 @@ async def test_poll_status_in_progress(bitbucket_config: BitbucketConfig) -> Non
         == "https://bitbucket.org/test-workspace/test-repo/pipelines/results/17"
     )
 
+    await provider.aclose()
+
 
 async def test_poll_status_completed_success(bitbucket_config: BitbucketConfig) -> None:
     """poll_status returns complete with success status."""
     provider = BitbucketProvider(bitbucket_config)
     # Manually populate context as if dispatch_test was called
-    provider._pipeline_context["abc-123"] = (
+    provider._pipeline_context["abc-123"] = _PipelineContext(
         "scanner1",
         "test1",
         "https://bitbucket.org/test-workspace/test-repo/pipelines/results/17",
@@ -236,17 +257,20 @@ async def test_poll_status_completed_success(bitbucket_config: BitbucketConfig)
     assert is_complete is True
     assert result.status == "success"
     assert result.provider == "bitbucket"
+    assert "abc-123" not in provider._pipeline_context
     assert (
         result.run_url
         == "https://bitbucket.org/test-workspace/test-repo/pipelines/results/17"
     )
 
+    await provider.aclose()
+
 
 async def test_poll_status_completed_failure(bitbucket_config: BitbucketConfig) -> None:
     """poll_status returns complete with failure status."""
     provider = BitbucketProvider(bitbucket_config)
     # Manually populate context as if dispatch_test was called
-    provider._pipeline_context["abc-123"] = (
+    provider._pipeline_context["abc-123"] = _PipelineContext(
         "scanner1",
         "test1",
         "https://bitbucket.org/test-workspace/test-repo/pipelines/results/17",
@@ -271,6 +295,8 @@ async def test_poll_status_completed_failure(bitbucket_config: BitbucketConfig)
         == "https://bitbucket.org/test-workspace/test-repo/pipelines/results/17"
     )
 
+    await provider.aclose()
+
 
 async def test_poll_status_api_error(bitbucket_config: BitbucketConfig) -> None:
     """poll_status raises RuntimeError on API failure."""
@@ -288,6 +314,8 @@ async def test_poll_status_api_error(bitbucket_config: BitbucketConfig) -> None:
         with pytest.raises(RuntimeError, match="Failed to get pipeline"):
             await provider.poll_status("abc-123")
 
+    await provider.aclose()
+
 
 async def test_map_result_all_statuses(bitbucket_config: BitbucketConfig) -> None:
     """_map_result handles all Bitbucket result types."""
@@ -304,7 +332,7 @@ async def test_poll_status_invalid_state(bitbucket_config: BitbucketConfig) -> N
     """poll_status handles invalid state gracefully."""
     provider = BitbucketProvider(bitbucket_config)
     # Manually populate context as if dispatch_test was called
-    provider._pipeline_context["abc-123"] = (
+    provider._pipeline_context["abc-123"] = _PipelineContext(
         "scanner1",
         "test1",
         "https://bitbucket.org/test-workspace/test-repo/pipelines/results/17",
@@ -325,12 +353,14 @@ async def test_poll_status_invalid_state(bitbucket_config: BitbucketConfig) -> N
     assert is_complete is False
     assert result.status == "error"
 
+    await provider.aclose()
+
 
 async def test_poll_status_result_not_dict(bitbucket_config: BitbucketConfig) -> None:
     """poll_status handles non-dict result gracefully."""
     provider = BitbucketProvider(bitbucket_config)
     # Manually populate context as if dispatch_test was called
-    provider._pipeline_context["abc-123"] = (
+    provider._pipeline_context["abc-123"] = _PipelineContext(
         "scanner1",
         "test1",
         "https://bitbucket.org/test-workspace/test-repo/pipelines/results/17",
@@ -350,3 +380,5 @@ async def test_poll_status_result_not_dict(bitbucket_config: BitbucketConfig) ->
 
     assert is_complete is True
     assert result.status == "error"
+
+    await provider.aclose()
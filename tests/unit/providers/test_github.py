@@ -1,5 +1,6 @@
 """Tests for GitHub Actions provider."""
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -38,7 +39,7 @@ def test_definition() -> Test:
 async def test_dispatch_test_success(
     github_config: GitHubConfig, test_definition: Test
 ) -> None:
-    """dispatch_test successfully dispatches workflow and finds run."""
+    """dispatch_test dispatches the workflow and find_run finds its run."""
     provider = GitHubProvider(github_config)
 
     with aioresponses() as m:
@@ -52,7 +53,7 @@ async def test_dispatch_test_success(
         # Mock workflow run list
         m.get(
             f"https://api.github.com/repos/{github_config.owner}/{github_config.repo}/"
-            "actions/runs?per_page=5",
+            "actions/runs?per_page=30",
             payload={
                 "workflow_runs": [
                     {
@@ -66,15 +67,18 @@ async def test_dispatch_test_success(
         )
 
         with patch("asyncio.sleep"):
-            run_id = await provider.dispatch_test(
+            dispatch_id = await provider.dispatch_test(
                 "boostsecurityio/trivy-fs",
                 test_definition,
                 "main",
                 "test/registry",
             )
+            run_id = await provider.find_run(dispatch_id)
 
     assert run_id == "123456"
 
+    await provider.aclose()
+
 
 async def test_dispatch_test_with_scan_configs(github_config: GitHubConfig) -> None:
     """dispatch_test includes scan_configs when provided."""
@@ -99,7 +103,7 @@ async def test_dispatch_test_with_scan_configs(github_config: GitHubConfig) -> N
         )
         m.get(
             f"https://api.github.com/repos/{github_config.owner}/{github_config.repo}/"
-            "actions/runs?per_page=5",
+            "actions/runs?per_page=30",
             payload={
                 "workflow_runs": [
                     {
@@ -113,15 +117,18 @@ async def test_dispatch_test_with_scan_configs(github_config: GitHubConfig) -> N
         )
 
         with patch("asyncio.sleep"):
-            run_id = await provider.dispatch_test(
+            dispatch_id = await provider.dispatch_test(
                 "boostsecurityio/trivy-fs",
                 test_with_configs,
                 "main",
                 "test/registry",
             )
+            run_id = await provider.find_run(dispatch_id)
 
     assert run_id == "123456"
 
+    await provider.aclose()
+
 
 async def test_dispatch_test_failure(
     github_config: GitHubConfig, test_definition: Test
@@ -145,6 +152,8 @@ async def test_dispatch_test_failure(
                 "test/registry",
             )
 
+    await provider.aclose()
+
 
 async def test_poll_status_in_progress(github_config: GitHubConfig) -> None:
     """poll_status returns not complete when run is in progress."""
@@ -167,6 +176,8 @@ async def test_poll_status_in_progress(github_config: GitHubConfig) -> None:
     assert result.provider == "github"
     assert result.status == "error"
 
+    await provider.aclose()
+
 
 async def test_poll_status_completed_success(github_config: GitHubConfig) -> None:
     """poll_status returns complete with success status."""
@@ -192,6 +203,8 @@ async def test_poll_status_completed_success(github_config: GitHubConfig) -> Non
     assert result.provider == "github"
     assert result.duration == 90.0  # 1 minute 30 seconds
 
+    await provider.aclose()
+
 
 async def test_poll_status_completed_failure(github_config: GitHubConfig) -> None:
     """poll_status returns complete with failure status."""
@@ -216,6 +229,8 @@ async def test_poll_status_completed_failure(github_config: GitHubConfig) -> Non
     assert result.status == "failure"
     assert result.duration == 345.0  # 5 minutes 45 seconds
 
+    await provider.aclose()
+
 
 async def test_poll_status_api_error(github_config: GitHubConfig) -> None:
     """poll_status raises RuntimeError on API failure."""
@@ -232,6 +247,8 @@ async def test_poll_status_api_error(github_config: GitHubConfig) -> None:
         with pytest.raises(RuntimeError, match="Failed to get workflow run"):
             await provider.poll_status("123456")
 
+    await provider.aclose()
+
 
 async def test_map_conclusion_all_statuses(github_config: GitHubConfig) -> None:
     """_map_conclusion handles all GitHub conclusion types."""
@@ -314,7 +331,7 @@ async def test_find_workflow_run_not_found(github_config: GitHubConfig) -> None:
         for _ in range(10):
             m.get(
                 f"https://api.github.com/repos/{github_config.owner}/{github_config.repo}/"
-                "actions/runs?per_page=5",
+                "actions/runs?per_page=30",
                 payload={"workflow_runs": []},
             )
 
@@ -328,6 +345,8 @@ async def test_find_workflow_run_not_found(github_config: GitHubConfig) -> None:
                     test_name="smoke test",
                 )
 
+    await provider.aclose()
+
 
 async def test_fetch_recent_runs_api_error(github_config: GitHubConfig) -> None:
     """_fetch_recent_runs raises RuntimeError on API failure."""
@@ -336,7 +355,7 @@ async def test_fetch_recent_runs_api_error(github_config: GitHubConfig) -> None:
     with aioresponses() as m:
         m.get(
             f"https://api.github.com/repos/{github_config.owner}/{github_config.repo}/"
-            "actions/runs?per_page=5",
+            "actions/runs?per_page=30",
             status=500,
             body="Internal Server Error",
         )
@@ -344,6 +363,8 @@ async def test_fetch_recent_runs_api_error(github_config: GitHubConfig) -> None:
         with pytest.raises(RuntimeError, match="Failed to list workflow runs"):
             await provider._fetch_recent_runs()
 
+    await provider.aclose()
+
 
 async def test_find_matching_run_skips_invalid_runs(
     github_config: GitHubConfig,
@@ -392,3 +413,154 @@ async def test_find_matching_run_skips_invalid_runs(
         test_name="smoke test",
     )
     assert run_id == "123456"
+
+
+async def test_find_workflow_run_backs_off(github_config: GitHubConfig) -> None:
+    """_find_workflow_run waits longer between each lookup, up to a cap."""
+    provider = GitHubProvider(github_config)
+
+    with (
+        patch.object(provider, "_fetch_recent_runs", return_value=[]),
+        patch("asyncio.sleep") as mock_sleep,
+        patch(
+            "boostsec.registry_test_action.providers.github.random.uniform",
+            return_value=0.0,
+        ),
+        pytest.raises(RuntimeError, match="Could not find dispatched workflow run"),
+    ):
+        await provider._find_workflow_run(
+            dispatch_time=0.0, scanner_id="org/scanner", test_name="test"
+        )
+
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert delays == [1.0, 1.5, 2.25, 3.375, 5.0625, 7.59375, 8.0, 8.0, 8.0]
+
+
+async def test_fetch_recent_runs_shared_between_callers(
+    github_config: GitHubConfig,
+) -> None:
+    """Concurrent _fetch_recent_runs calls share a single request."""
+    provider = GitHubProvider(github_config)
+    runs = [{"id": 1}]
+
+    with aioresponses() as m:
+        m.get(
+            f"https://api.github.com/repos/{github_config.owner}/{github_config.repo}/"
+            "actions/runs?per_page=30",
+            payload={"workflow_runs": runs},
+        )
+
+        first, second = await asyncio.gather(
+            provider._fetch_recent_runs(), provider._fetch_recent_runs()
+        )
+
+    assert first == second == runs
+    assert provider._recent_runs_task is None
+
+    await provider.aclose()
+
+
+async def test_fetch_recent_runs_reuses_recent_listing(
+    github_config: GitHubConfig,
+) -> None:
+    """_fetch_recent_runs reuses a listing until it is older than the TTL."""
+    provider = GitHubProvider(github_config)
+    url = (
+        f"https://api.github.com/repos/{github_config.owner}/{github_config.repo}/"
+        "actions/runs?per_page=30"
+    )
+
+    with aioresponses() as m:
+        m.get(url, payload={"workflow_runs": [{"id": 1}]})
+        m.get(url, payload={"workflow_runs": [{"id": 2}]})
+
+        first = await provider._fetch_recent_runs()
+        cached = await provider._fetch_recent_runs()
+
+        assert provider._recent_runs is not None
+        fetched_at, runs = provider._recent_runs
+        provider._recent_runs = (fetched_at - 2, runs)
+        refreshed = await provider._fetch_recent_runs()
+
+    assert first == cached == [{"id": 1}]
+    assert refreshed == [{"id": 2}]
+
+    await provider.aclose()
+
+
+async def test_find_matching_run_time_window(github_config: GitHubConfig) -> None:
+    """_find_matching_run ignores runs created before the dispatch window."""
+    provider = GitHubProvider(github_config)
+    # 2024-01-01T12:00:00Z
+    dispatch_time = 1704110400.0
+
+    def run(created_at: str, run_id: int) -> dict[str, object]:
+        return {
+            "status": "queued",
+            "display_title": "[boostsecurityio/trivy-fs] smoke test",
+            "created_at": created_at,
+            "id": run_id,
+        }
+
+    too_old: list[object] = [run("2024-01-01T11:58:59Z", 1)]
+    in_window: list[object] = [run("2024-01-01T11:59:00Z", 2)]
+
+    assert (
+        provider._find_matching_run(
+            too_old, dispatch_time, "boostsecurityio/trivy-fs", "smoke test"
+        )
+        is None
+    )
+    assert (
+        provider._find_matching_run(
+            in_window, dispatch_time, "boostsecurityio/trivy-fs", "smoke test"
+        )
+        == "2"
+    )
+    # Runs are listed newest first, so nothing after a too-old run is checked.
+    assert (
+        provider._find_matching_run(
+            too_old + in_window,
+            dispatch_time,
+            "boostsecurityio/trivy-fs",
+            "smoke test",
+        )
+        is None
+    )
+
+
+async def test_poll_status_revalidates_with_etag(github_config: GitHubConfig) -> None:
+    """poll_status sends the last ETag and reuses the body on 304."""
+    provider = GitHubProvider(github_config)
+    url = (
+        f"https://api.github.com/repos/{github_config.owner}/{github_config.repo}/"
+        "actions/runs/123456"
+    )
+
+    with aioresponses() as m:
+        m.get(
+            url,
+            payload={"status": "in_progress", "html_url": "https://run"},
+            headers={"ETag": '"v1"'},
+        )
+        m.get(url, status=304)
+        m.get(
+            url,
+            payload={"status": "completed", "conclusion": "success"},
+            headers={"ETag": '"v2"'},
+        )
+
+        first = await provider.poll_status("123456")
+        second = await provider.poll_status("123456")
+        third = await provider.poll_status("123456")
+
+        requests = [call.kwargs["headers"] for call in next(iter(m.requests.values()))]
+
+    assert first == second
+    assert first[1].run_url == "https://run"
+    assert "If-None-Match" not in requests[0]
+    assert requests[1]["If-None-Match"] == '"v1"'
+    assert third[0] is True
+    assert provider._etags == {}
+
+    await provider.aclose()
@@ -59,6 +59,8 @@ async def test_dispatch_test_success(
         "smoke test",
     )
 
+    await provider.aclose()
+
 
 async def test_dispatch_test_with_scan_configs(gitlab_config: GitLabConfig) -> None:
     """dispatch_test includes scan_configs when provided."""
@@ -91,6 +93,8 @@ async def test_dispatch_test_with_scan_configs(gitlab_config: GitLabConfig) -> N
 
     assert pipeline_id == "789"
 
+    await provider.aclose()
+
 
 async def test_dispatch_test_failure(
     gitlab_config: GitLabConfig, test_definition: Test
@@ -113,6 +117,8 @@ async def test_dispatch_test_failure(
                 "test/registry",
             )
 
+    await provider.aclose()
+
 
 async def test_dispatch_test_missing_pipeline_id(
     gitlab_config: GitLabConfig, test_definition: Test
@@ -135,6 +141,8 @@ async def test_dispatch_test_missing_pipeline_id(
                 "test/registry",
             )
 
+    await provider.aclose()
+
 
 async def test_poll_status_running(
     gitlab_config: GitLabConfig, test_definition: Test
@@ -174,6 +182,9 @@ async def test_poll_status_running(
     assert result.scanner == "boostsecurityio/trivy-fs"
     assert result.test_name == "smoke test"
     assert result.status == "error"
+    assert "789" in provider._pipeline_context
+
+    await provider.aclose()
 
 
 async def test_poll_status_completed_success(
@@ -214,6 +225,9 @@ async def test_poll_status_completed_success(
     assert result.provider == "gitlab"
     assert result.scanner == "boostsecurityio/trivy-fs"
     assert result.test_name == "smoke test"
+    assert "789" not in provider._pipeline_context
+
+    await provider.aclose()
 
 
 async def test_poll_status_completed_failure(
@@ -254,6 +268,8 @@ async def test_poll_status_completed_failure(
     assert result.scanner == "boostsecurityio/trivy-fs"
     assert result.test_name == "smoke test"
 
+    await provider.aclose()
+
 
 async def test_poll_status_api_error(gitlab_config: GitLabConfig) -> None:
     """poll_status raises RuntimeError on API failure."""
@@ -270,6 +286,8 @@ async def test_poll_status_api_error(gitlab_config: GitLabConfig) -> None:
         with pytest.raises(RuntimeError, match="Failed to get pipeline"):
             await provider.poll_status("789")
 
+    await provider.aclose()
+
 
 async def test_map_status_all_statuses(gitlab_config: GitLabConfig) -> None:
     """_map_status handles all GitLab status types."""
@@ -315,3 +333,5 @@ async def test_dispatch_test_with_project_path(test_definition: Test) -> None:
         )
 
     assert pipeline_id == "789"
+
+    await provider.aclose()
@@ -1,13 +1,19 @@
 """Tests for CLI entry point."""
 
 import json
+import subprocess
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from typer.testing import CliRunner
 
-from boostsec.registry_test_action.cli import app, get_current_commit_sha
+from boostsec.registry_test_action.cli import (
+    _log_format,
+    _read_head_sha,
+    app,
+    get_current_commit_sha,
+)
 from boostsec.registry_test_action.models.test_result import TestResult
 
 runner = CliRunner()
@@ -68,6 +74,17 @@ def test_main_success_with_results() -> None:
     assert output["total"] == 1
     assert output["passed"] == 1
     assert output["failed"] == 0
+    assert output["results"] == [
+        {
+            "provider": "github",
+            "scanner": "scanner1",
+            "test_name": "test1",
+            "status": "success",
+            "duration": 10.0,
+            "message": None,
+            "run_url": None,
+        }
+    ]
 
 
 def test_main_failure_with_failed_tests() -> None:
@@ -228,7 +245,7 @@ def test_main_github_custom_api_url() -> None:
             return_value=mock_orchestrator,
         ),
         patch(
-            "boostsec.registry_test_action.cli.GitHubProvider"
+            "boostsec.registry_test_action.providers.github.GitHubProvider"
         ) as mock_provider_class,
         patch(
             "boostsec.registry_test_action.cli.get_current_commit_sha",
@@ -567,8 +584,6 @@ def test_main_invalid_json_config() -> None:
 
 def test_get_current_commit_sha_success(tmp_path: Path) -> None:
     """get_current_commit_sha returns the current commit SHA."""
-    import subprocess
-
     # Initialize a git repo and create a commit
     subprocess.run(
         ["git", "init"],  # noqa: S607
@@ -652,3 +667,226 @@ def test_main_sha_retrieval_failure() -> None:
 
     assert result.exit_code == 1
     assert "Git error" in result.output
+
+
+def test_get_current_commit_sha_falls_back_to_git(tmp_path: Path) -> None:
+    """get_current_commit_sha asks git when HEAD cannot be read directly."""
+    completed = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="a" * 40 + "\n"
+    )
+
+    with patch(
+        "boostsec.registry_test_action.cli.subprocess.run", return_value=completed
+    ) as mock_run:
+        assert get_current_commit_sha(tmp_path) == "a" * 40
+
+    mock_run.assert_called_once()
+
+
+def test_main_head_ref_sha_still_uses_checkout() -> None:
+    """Main dispatches against the checked-out commit even for a SHA head_ref."""
+    head_sha = "0123456789abcdef0123456789abcdef01234567"
+    checkout_sha = "fedcba9876543210fedcba9876543210fedcba98"
+    mock_orchestrator = AsyncMock()
+    mock_orchestrator.run_tests = AsyncMock(return_value=[])
+
+    config_json = json.dumps(
+        {
+            "token": "token",
+            "owner": "owner",
+            "repo": "repo",
+            "workflow_id": "workflow.yml",
+        }
+    )
+
+    with (
+        patch(
+            "boostsec.registry_test_action.cli.TestOrchestrator",
+            return_value=mock_orchestrator,
+        ),
+        patch(
+            "boostsec.registry_test_action.cli.get_current_commit_sha",
+            return_value=checkout_sha,
+        ) as mock_sha,
+    ):
+        result = runner.invoke(
+            app,
+            [
+                "--registry-path",
+                "/test/registry",
+                "--base-ref",
+                "main",
+                "--head-ref",
+                head_sha,
+                "--provider",
+                "github",
+                "--provider-config",
+                config_json,
+            ],
+        )
+
+    assert result.exit_code == 0
+    mock_sha.assert_called_once_with(Path("/test/registry"))
+    mock_orchestrator.run_tests.assert_awaited_once_with(
+        Path("/test/registry"), "main", head_sha, checkout_sha
+    )
+
+
+def test_get_current_commit_sha_detached_head(tmp_path: Path) -> None:
+    """get_current_commit_sha reads a detached HEAD without running git."""
+    sha = "b" * 40
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text(f"{sha}\n")
+
+    with patch("boostsec.registry_test_action.cli.subprocess.run") as mock_run:
+        assert get_current_commit_sha(tmp_path) == sha
+
+    mock_run.assert_not_called()
+
+
+def test_read_head_sha_loose_ref(tmp_path: Path) -> None:
+    """_read_head_sha follows a symbolic HEAD to a loose ref."""
+    sha = "c" * 40
+    (tmp_path / "refs" / "heads").mkdir(parents=True)
+    (tmp_path / "HEAD").write_text("ref: refs/heads/main\n")
+    (tmp_path / "refs" / "heads" / "main").write_text(f"{sha}\n")
+
+    assert _read_head_sha(tmp_path) == sha
+
+
+def test_read_head_sha_packed_ref(tmp_path: Path) -> None:
+    """_read_head_sha falls back to packed-refs when the loose ref is missing."""
+    sha = "d" * 40
+    (tmp_path / "HEAD").write_text("ref: refs/heads/main\n")
+    (tmp_path / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        f"{'e' * 40} refs/heads/other\n"
+        f"{sha} refs/heads/main\n"
+    )
+
+    assert _read_head_sha(tmp_path) == sha
+
+
+@pytest.mark.parametrize(
+    ("head", "packed_refs"),
+    [
+        (None, None),
+        ("not-a-ref\n", None),
+        ("ref: refs/heads/main\n", None),
+        ("ref: refs/heads/main\n", f"{'e' * 40} refs/heads/other\n"),
+    ],
+)
+def test_read_head_sha_unresolved(
+    tmp_path: Path, head: str | None, packed_refs: str | None
+) -> None:
+    """_read_head_sha returns None when HEAD cannot be resolved in-process."""
+    if head is not None:
+        (tmp_path / "HEAD").write_text(head)
+    if packed_refs is not None:
+        (tmp_path / "packed-refs").write_text(packed_refs)
+
+    assert _read_head_sha(tmp_path) is None
+
+
+def test_main_provider_config_not_an_object() -> None:
+    """Main exits with a validation error when provider-config is not an object."""
+    with patch(
+        "boostsec.registry_test_action.cli.get_current_commit_sha",
+        return_value="abc123",
+    ):
+        result = runner.invoke(
+            app,
+            [
+                "--registry-path",
+                "/test/registry",
+                "--base-ref",
+                "main",
+                "--head-ref",
+                "feature",
+                "--provider",
+                "gitlab",
+                "--provider-config",
+                '["token", "12345"]',
+            ],
+        )
+
+    assert result.exit_code == 1
+    assert "validation error for GitLabConfig" in result.output
+
+
+@pytest.mark.parametrize(("status", "exit_code"), [("success", 0), ("timeout", 1)])
+def test_main_quiet_skips_summary(status: str, exit_code: int) -> None:
+    """Main only reports the outcome through the exit code with --quiet."""
+    results = [
+        TestResult(
+            provider="github",
+            scanner="scanner1",
+            test_name="test1",
+            status=status,  # type: ignore[arg-type]
+            duration=10.0,
+        )
+    ]
+
+    mock_orchestrator = AsyncMock()
+    mock_orchestrator.run_tests = AsyncMock(return_value=results)
+
+    config_json = json.dumps(
+        {
+            "token": "token",
+            "owner": "owner",
+            "repo": "repo",
+            "workflow_id": "workflow.yml",
+        }
+    )
+
+    with (
+        patch(
+            "boostsec.registry_test_action.cli.TestOrchestrator",
+            return_value=mock_orchestrator,
+        ),
+        patch(
+            "boostsec.registry_test_action.cli.get_current_commit_sha",
+            return_value="abc123",
+        ),
+    ):
+        result = runner.invoke(
+            app,
+            [
+                "--registry-path",
+                "/test/registry",
+                "--base-ref",
+                "main",
+                "--head-ref",
+                "feature",
+                "--provider",
+                "github",
+                "--provider-config",
+                config_json,
+                "--quiet",
+            ],
+        )
+
+    assert result.exit_code == exit_code
+    assert result.stdout == ""
+
+
+@pytest.mark.parametrize(
+    ("github_actions", "isatty", "has_timestamp"),
+    [
+        ("true", False, False),
+        ("true", True, True),
+        (None, False, True),
+    ],
+)
+def test_log_format(
+    github_actions: str | None, isatty: bool, has_timestamp: bool
+) -> None:
+    """_log_format only drops timestamps for redirected GitHub Actions logs."""
+    env = {"GITHUB_ACTIONS": github_actions} if github_actions else {}
+    with (
+        patch.dict("os.environ", env, clear=True),
+        patch("sys.stderr.isatty", return_value=isatty),
+    ):
+        log_format = _log_format()
+
+    assert ("%(asctime)s" in log_format) is has_timestamp
@@ -1,5 +1,7 @@
 """Tests for test orchestrator."""
 
+import asyncio
+import subprocess
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -55,7 +57,11 @@ class TestProvider(PipelineProvider):
         )  # pragma: no cover
 
     async def wait_for_completion(
-        self, run_id: str, timeout: float = 1800, poll_interval: float = 30
+        self,
+        run_id: str,
+        timeout: float = 1800,
+        poll_interval: float = 5,
+        max_poll_interval: float = 60,
     ) -> TestResult:
         """Mock wait for completion."""
         result: TestResult = await self.wait_for_completion_mock(
@@ -235,6 +241,65 @@ async def test_run_tests_handles_exceptions(test_provider: TestProvider) -> None
     assert results[0].message == "API Error"
 
 
+async def test_run_tests_propagates_cancellation(
+    test_provider: TestProvider,
+) -> None:
+    """run_tests re-raises cancellation and stops the remaining tests."""
+    orchestrator = TestOrchestrator(test_provider)
+
+    tests = [
+        Test(
+            name=name,
+            type="source-code",
+            source=TestSource(url="https://github.com/test/repo.git", ref="main"),
+        )
+        for name in ("cancelled", "slow")
+    ]
+    test_def = TestDefinition(version="1.0", tests=tests)
+    slow_cancelled = False
+
+    async def dispatch_test(
+        scanner_id: str, test: Test, registry_ref: str, registry_repo: str
+    ) -> str:
+        return test.name
+
+    async def wait_for_completion(
+        run_id: str, timeout: float, poll_interval: float
+    ) -> TestResult:
+        nonlocal slow_cancelled
+        if run_id == "cancelled":
+            raise asyncio.CancelledError
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            slow_cancelled = True
+            raise
+        raise AssertionError("not reached")  # pragma: no cover
+
+    test_provider.dispatch_test_mock.side_effect = dispatch_test
+    test_provider.wait_for_completion_mock.side_effect = wait_for_completion
+
+    with (
+        patch(
+            "boostsec.registry_test_action.orchestrator.get_repository_identifier"
+        ) as mock_url,
+        patch(
+            "boostsec.registry_test_action.orchestrator.detect_changed_scanners"
+        ) as mock_detect,
+        patch("boostsec.registry_test_action.orchestrator.load_all_tests") as mock_load,
+    ):
+        mock_url.return_value = "test/registry"
+        mock_detect.return_value = ["scanner1"]
+        mock_load.return_value = {"scanner1": test_def}
+
+        with pytest.raises(asyncio.CancelledError):
+            await orchestrator.run_tests(
+                Path("/test/registry"), "main", "feature", "feature"
+            )
+
+    assert slow_cancelled
+
+
 async def test_run_tests_skips_scanners_without_test_definitions(
     test_provider: TestProvider,
 ) -> None:
@@ -264,8 +329,6 @@ async def test_run_tests_skips_scanners_without_test_definitions(
 
 def test_get_repository_identifier_success(tmp_path: Path) -> None:
     """get_repository_identifier returns org/repo from git config."""
-    import subprocess
-
     # Initialize a git repo
     subprocess.run(
         ["git", "init"],  # noqa: S607
@@ -287,8 +350,6 @@ def test_get_repository_identifier_success(tmp_path: Path) -> None:
 
 def test_get_repository_identifier_ssh_url(tmp_path: Path) -> None:
     """get_repository_identifier parses SSH URL format."""
-    import subprocess
-
     # Initialize a git repo with SSH URL
     subprocess.run(
         ["git", "init"],  # noqa: S607
@@ -310,8 +371,6 @@ def test_get_repository_identifier_ssh_url(tmp_path: Path) -> None:
 
 def test_get_repository_identifier_unparseable_url(tmp_path: Path) -> None:
     """get_repository_identifier raises RuntimeError for unparseable URL."""
-    import subprocess
-
     # Initialize a git repo with unusual URL format
     subprocess.run(
         ["git", "init"],  # noqa: S607
@@ -335,3 +394,294 @@ def test_get_repository_identifier_failure(tmp_path: Path) -> None:
     # Create directory without git repo
     with pytest.raises(RuntimeError, match="Failed to get repository URL"):
         get_repository_identifier(tmp_path)
+
+
+async def test_run_tests_returns_results_in_dispatch_order(
+    test_provider: TestProvider, caplog: pytest.LogCaptureFixture
+) -> None:
+    """run_tests logs results as tests finish but returns them in order."""
+    orchestrator = TestOrchestrator(test_provider)
+
+    slow = Test(
+        name="slow",
+        type="source-code",
+        source=TestSource(url="https://github.com/test/repo.git", ref="main"),
+    )
+    fast = Test(
+        name="fast",
+        type="source-code",
+        source=TestSource(url="https://github.com/test/repo.git", ref="main"),
+    )
+    test_def = TestDefinition(version="1.0", tests=[slow, fast])
+
+    async def wait_for_completion(
+        run_id: str, timeout: float, poll_interval: float
+    ) -> TestResult:
+        await asyncio.sleep(0.05 if run_id == "slow-run" else 0)
+        return TestResult(
+            provider="test", scanner="", test_name="", status="success", duration=1.0
+        )
+
+    async def dispatch_test(
+        scanner_id: str, test: Test, registry_ref: str, registry_repo: str
+    ) -> str:
+        return f"{test.name}-run"
+
+    test_provider.dispatch_test_mock.side_effect = dispatch_test
+    test_provider.wait_for_completion_mock.side_effect = wait_for_completion
+
+    with (
+        patch(
+            "boostsec.registry_test_action.orchestrator.get_repository_identifier"
+        ) as mock_url,
+        patch(
+            "boostsec.registry_test_action.orchestrator.detect_changed_scanners"
+        ) as mock_detect,
+        patch("boostsec.registry_test_action.orchestrator.load_all_tests") as mock_load,
+    ):
+        mock_url.return_value = "test/registry"
+        mock_detect.return_value = ["scanner1"]
+        mock_load.return_value = {"scanner1": test_def}
+
+        with caplog.at_level("INFO"):
+            results = await orchestrator.run_tests(
+                Path("/test/registry"), "main", "feature", "feature"
+            )
+
+    assert [r.test_name for r in results] == ["slow", "fast"]
+    logged = [r.message for r in caplog.records if r.message.startswith("Test result")]
+    assert logged == [
+        "Test result: scanner1/fast = success",
+        "Test result: scanner1/slow = success",
+    ]
+
+
+async def test_run_tests_waits_for_all_tests_in_parallel(
+    test_provider: TestProvider,
+) -> None:
+    """run_tests waits for every dispatched test at the same time."""
+    orchestrator = TestOrchestrator(test_provider, max_dispatch_concurrency=1)
+
+    tests = [
+        Test(
+            name=f"test{i}",
+            type="source-code",
+            source=TestSource(url="https://github.com/test/repo.git", ref="main"),
+        )
+        for i in range(5)
+    ]
+    test_def = TestDefinition(version="1.0", tests=tests)
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def wait_for_completion(
+        run_id: str, timeout: float, poll_interval: float
+    ) -> TestResult:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return TestResult(
+            provider="test", scanner="", test_name="", status="success", duration=1.0
+        )
+
+    test_provider.dispatch_test_mock.return_value = "run"
+    test_provider.wait_for_completion_mock.side_effect = wait_for_completion
+
+    with (
+        patch(
+            "boostsec.registry_test_action.orchestrator.get_repository_identifier"
+        ) as mock_url,
+        patch(
+            "boostsec.registry_test_action.orchestrator.detect_changed_scanners"
+        ) as mock_detect,
+        patch("boostsec.registry_test_action.orchestrator.load_all_tests") as mock_load,
+    ):
+        mock_url.return_value = "test/registry"
+        mock_detect.return_value = ["scanner1"]
+        mock_load.return_value = {"scanner1": test_def}
+
+        results = await orchestrator.run_tests(
+            Path("/test/registry"), "main", "feature", "feature"
+        )
+
+    assert len(results) == 5
+    assert max_in_flight == 5
+
+
+async def test_run_tests_bounds_dispatch_concurrency(
+    test_provider: TestProvider,
+) -> None:
+    """run_tests limits the number of dispatches at once."""
+    orchestrator = TestOrchestrator(test_provider, max_dispatch_concurrency=1)
+
+    tests = [
+        Test(
+            name=f"test{i}",
+            type="source-code",
+            source=TestSource(url="https://github.com/test/repo.git", ref="main"),
+        )
+        for i in range(4)
+    ]
+    test_def = TestDefinition(version="1.0", tests=tests)
+
+    dispatching = 0
+    max_dispatching = 0
+
+    async def dispatch_test(*args: object) -> str:
+        nonlocal dispatching, max_dispatching
+        dispatching += 1
+        max_dispatching = max(max_dispatching, dispatching)
+        await asyncio.sleep(0.01)
+        dispatching -= 1
+        return "run"
+
+    test_provider.dispatch_test_mock.side_effect = dispatch_test
+    test_provider.wait_for_completion_mock.return_value = TestResult(
+        provider="test", scanner="", test_name="", status="success", duration=1.0
+    )
+
+    with (
+        patch(
+            "boostsec.registry_test_action.orchestrator.get_repository_identifier"
+        ) as mock_url,
+        patch(
+            "boostsec.registry_test_action.orchestrator.detect_changed_scanners"
+        ) as mock_detect,
+        patch("boostsec.registry_test_action.orchestrator.load_all_tests") as mock_load,
+    ):
+        mock_url.return_value = "test/registry"
+        mock_detect.return_value = ["scanner1"]
+        mock_load.return_value = {"scanner1": test_def}
+
+        results = await orchestrator.run_tests(
+            Path("/test/registry"), "main", "feature", "feature"
+        )
+
+    assert len(results) == 4
+    assert max_dispatching == 1
+
+
+async def test_run_tests_finds_runs_outside_dispatch_limit(
+    test_provider: TestProvider,
+) -> None:
+    """run_tests does not hold a dispatch slot while finding the run."""
+    orchestrator = TestOrchestrator(test_provider, max_dispatch_concurrency=1)
+
+    tests = [
+        Test(
+            name=f"test{i}",
+            type="source-code",
+            source=TestSource(url="https://github.com/test/repo.git", ref="main"),
+        )
+        for i in range(3)
+    ]
+    test_def = TestDefinition(version="1.0", tests=tests)
+
+    finding = 0
+    max_finding = 0
+
+    async def find_run(run_id: str) -> str:
+        nonlocal finding, max_finding
+        finding += 1
+        max_finding = max(max_finding, finding)
+        await asyncio.sleep(0.01)
+        finding -= 1
+        return f"found-{run_id}"
+
+    test_provider.dispatch_test_mock.side_effect = ["run1", "run2", "run3"]
+    test_provider.wait_for_completion_mock.return_value = TestResult(
+        provider="test", scanner="", test_name="", status="success", duration=1.0
+    )
+
+    with (
+        patch.object(test_provider, "find_run", side_effect=find_run),
+        patch(
+            "boostsec.registry_test_action.orchestrator.get_repository_identifier"
+        ) as mock_url,
+        patch(
+            "boostsec.registry_test_action.orchestrator.detect_changed_scanners"
+        ) as mock_detect,
+        patch("boostsec.registry_test_action.orchestrator.load_all_tests") as mock_load,
+    ):
+        mock_url.return_value = "test/registry"
+        mock_detect.return_value = ["scanner1"]
+        mock_load.return_value = {"scanner1": test_def}
+
+        results = await orchestrator.run_tests(
+            Path("/test/registry"), "main", "feature", "feature"
+        )
+
+    assert len(results) == 3
+    assert max_finding == 3
+    waited = {c.args[0] for c in test_provider.wait_for_completion_mock.call_args_list}
+    assert waited == {"found-run1", "found-run2", "found-run3"}
+
+
+def test_get_repository_identifier_reads_git_config(tmp_path: Path) -> None:
+    """get_repository_identifier reads the origin URL without running git."""
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config").write_text(
+        '[remote "origin"]\n'
+        "\turl = https://github.com/test/repo.git\n"
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+        "\tfetch = +refs/tags/*:refs/tags/*\n"
+    )
+
+    with patch("boostsec.registry_test_action.orchestrator.subprocess.run") as run:
+        assert get_repository_identifier(tmp_path) == "test/repo"
+
+    run.assert_not_called()
+
+
+def test_get_repository_identifier_malformed_config(tmp_path: Path) -> None:
+    """get_repository_identifier falls back to git for unparseable config."""
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config").write_text("url = no section header\n")
+
+    with pytest.raises(RuntimeError, match="Failed to get repository URL"):
+        get_repository_identifier(tmp_path)
+
+
+def test_get_repository_identifier_falls_back_to_git(tmp_path: Path) -> None:
+    """get_repository_identifier asks git when .git/config has no origin."""
+    completed = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"https://github.com/test/repo.git\n"
+    )
+
+    with patch(
+        "boostsec.registry_test_action.orchestrator.subprocess.run",
+        return_value=completed,
+    ) as run:
+        assert get_repository_identifier(tmp_path) == "test/repo"
+
+    run.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        b'[remote "origin"]\n\turl = https://github.com/test/repo.git\n# caf\xe9\n',
+        b'[remote "origin"]\n\turl = "https://github.com/test/repo.git"\n',
+        b'[remote "origin"]\n\turl = https://github.com/test/repo.git ; note\n',
+        b'[remote "origin"]\n\turl = https://github.com/test/repo.git # note\n',
+    ],
+    ids=["non-utf8", "quoted", "semicolon-comment", "hash-comment"],
+)
+def test_get_repository_identifier_defers_to_git(tmp_path: Path, config: bytes) -> None:
+    """get_repository_identifier asks git for values configparser misreads."""
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config").write_bytes(config)
+    completed = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"https://github.com/test/repo.git\n"
+    )
+
+    with patch(
+        "boostsec.registry_test_action.orchestrator.subprocess.run",
+        return_value=completed,
+    ) as run:
+        assert get_repository_identifier(tmp_path) == "test/repo"
+
+    run.assert_called_once()
@@ -1,5 +1,6 @@
 """Tests for scanner detector."""
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -9,11 +10,23 @@ from boostsec.registry_test_action.scanner_detector import (
     _extract_scanner_paths,
     _get_changed_files,
     _resolve_ref,
+    _resolve_refs,
     detect_changed_scanners,
     has_test_definition,
 )
 
 
+def _streaming_process(returncode: int, stdout: bytes, stderr: bytes) -> AsyncMock:
+    """Build a mock process whose stdout is read as a stream."""
+    process = AsyncMock()
+    process.returncode = returncode
+    process.stdout = asyncio.StreamReader()
+    process.stdout.feed_data(stdout)
+    process.stdout.feed_eof()
+    process.communicate = AsyncMock(return_value=(b"", stderr))
+    return process
+
+
 async def test_resolve_ref_exists() -> None:
     """_resolve_ref returns ref as-is when it exists."""
     mock_process = AsyncMock()
@@ -75,54 +88,87 @@ async def test_resolve_ref_skips_origin_for_refs() -> None:
             await _resolve_ref(Path("/repo"), "refs/heads/main")
 
 
-async def test_get_changed_files_success() -> None:
-    """_get_changed_files returns list of changed files from git diff."""
-    # Mock _resolve_ref calls (base_ref and head_ref)
-    mock_resolve_base = AsyncMock()
-    mock_resolve_base.returncode = 0
-    mock_resolve_base.communicate = AsyncMock(return_value=(b"abc123\n", b""))
+async def test_resolve_refs_single_process() -> None:
+    """_resolve_refs verifies all refs with a single git process."""
+    mock_process = AsyncMock()
+    mock_process.returncode = 0
+    mock_process.communicate = AsyncMock(return_value=(b"abc123\ndef456\n", b""))
 
-    mock_resolve_head = AsyncMock()
-    mock_resolve_head.returncode = 0
-    mock_resolve_head.communicate = AsyncMock(return_value=(b"def456\n", b""))
+    with patch(
+        "asyncio.create_subprocess_exec", return_value=mock_process
+    ) as mock_exec:
+        resolved = await _resolve_refs(Path("/repo"), "main", "HEAD")
 
-    # Mock git diff call
-    mock_diff = AsyncMock()
-    mock_diff.returncode = 0
-    mock_diff.communicate = AsyncMock(
-        return_value=(
-            b"scanners/org1/scanner1/module.yaml\nscanners/org2/scanner2/tests.yaml\n",
-            b"",
-        )
+    assert resolved == ["main", "HEAD"]
+    mock_exec.assert_called_once()
+
+
+async def test_resolve_refs_falls_back_per_ref() -> None:
+    """_resolve_refs resolves refs individually when one is missing."""
+    # Batched call drops the missing ref
+    mock_batch = AsyncMock()
+    mock_batch.returncode = 0
+    mock_batch.communicate = AsyncMock(return_value=(b"def456\n", b""))
+
+    mock_fail = AsyncMock()
+    mock_fail.returncode = 128
+    mock_fail.communicate = AsyncMock(
+        return_value=(b"", b"fatal: Needed a single revision\n")
     )
 
+    mock_success = AsyncMock()
+    mock_success.returncode = 0
+    mock_success.communicate = AsyncMock(return_value=(b"abc123\n", b""))
+
     with patch(
         "asyncio.create_subprocess_exec",
-        side_effect=[mock_resolve_base, mock_resolve_head, mock_diff],
+        side_effect=[mock_batch, mock_fail, mock_success, mock_success],
     ):
+        resolved = await _resolve_refs(Path("/repo"), "main", "HEAD")
+
+    assert resolved == ["origin/main", "HEAD"]
+
+
+async def test_get_changed_files_success() -> None:
+    """_get_changed_files returns changed scanner files from git diff."""
+    # Mock batched ref resolution (base_ref and head_ref)
+    mock_resolve = AsyncMock()
+    mock_resolve.returncode = 0
+    mock_resolve.communicate = AsyncMock(return_value=(b"abc123\ndef456\n", b""))
+
+    # Mock git diff call
+    mock_diff = _streaming_process(
+        0,
+        b"scanners/org1/scanner1/module.yaml\0scanners/org2/scanner2/tests.yaml\0",
+        b"",
+    )
+
+    with patch(
+        "asyncio.create_subprocess_exec",
+        side_effect=[mock_resolve, mock_diff],
+    ) as mock_exec:
         files = await _get_changed_files(Path("/repo"), "main", "HEAD")
 
     assert files == [
         "scanners/org1/scanner1/module.yaml",
         "scanners/org2/scanner2/tests.yaml",
     ]
+    assert mock_exec.call_args.args[-2:] == ("--", "scanners/")
 
 
 async def test_get_changed_files_empty() -> None:
     """_get_changed_files returns empty list when no files changed."""
-    # Mock _resolve_ref calls
+    # Mock batched ref resolution
     mock_resolve = AsyncMock()
     mock_resolve.returncode = 0
-    mock_resolve.communicate = AsyncMock(return_value=(b"abc123\n", b""))
+    mock_resolve.communicate = AsyncMock(return_value=(b"abc123\ndef456\n", b""))
 
     # Mock git diff call
-    mock_diff = AsyncMock()
-    mock_diff.returncode = 0
-    mock_diff.communicate = AsyncMock(return_value=(b"", b""))
+    mock_diff = _streaming_process(0, b"", b"")
 
     with patch(
         "asyncio.create_subprocess_exec",
-        side_effect=[mock_resolve, mock_resolve, mock_diff],
+        side_effect=[mock_resolve, mock_diff],
     ):
         files = await _get_changed_files(Path("/repo"), "main", "HEAD")
 
@@ -131,21 +177,17 @@ async def test_get_changed_files_empty() -> None:
 
 async def test_get_changed_files_error() -> None:
     """_get_changed_files raises RuntimeError when git command fails."""
-    # Mock _resolve_ref calls succeed
+    # Mock batched ref resolution succeeds
     mock_resolve = AsyncMock()
     mock_resolve.returncode = 0
-    mock_resolve.communicate = AsyncMock(return_value=(b"abc123\n", b""))
+    mock_resolve.communicate = AsyncMock(return_value=(b"abc123\ndef456\n", b""))
 
     # Mock git diff call fails
-    mock_diff = AsyncMock()
-    mock_diff.returncode = 128
-    mock_diff.communicate = AsyncMock(
-        return_value=(b"", b"fatal: bad revision 'invalid-ref'\n")
-    )
+    mock_diff = _streaming_process(128, b"", b"fatal: bad revision 'invalid-ref'\n")
 
     with patch(
         "asyncio.create_subprocess_exec",
-        side_effect=[mock_resolve, mock_resolve, mock_diff],
+        side_effect=[mock_resolve, mock_diff],
     ):
         with pytest.raises(RuntimeError, match="Git command failed"):
             await _get_changed_files(Path("/repo"), "invalid-ref", "HEAD")
@@ -201,22 +243,22 @@ def test_extract_scanner_paths_empty() -> None:
     assert scanners == []
 
 
-async def test_has_test_definition_exists(tmp_path: Path) -> None:
+def test_has_test_definition_exists(tmp_path: Path) -> None:
     """has_test_definition returns True when tests.yaml exists."""
     scanner_dir = tmp_path / "scanners" / "boostsecurityio" / "trivy-fs"
     scanner_dir.mkdir(parents=True)
     (scanner_dir / "tests.yaml").write_text("version: 1.0\n")
 
-    result = await has_test_definition(tmp_path, "boostsecurityio/trivy-fs")
+    result = has_test_definition(tmp_path, "boostsecurityio/trivy-fs")
     assert result is True
 
 
-async def test_has_test_definition_missing(tmp_path: Path) -> None:
+def test_has_test_definition_missing(tmp_path: Path) -> None:
     """has_test_definition returns False when tests.yaml doesn't exist."""
     scanner_dir = tmp_path / "scanners" / "boostsecurityio" / "trivy-fs"
     scanner_dir.mkdir(parents=True)
 
-    result = await has_test_definition(tmp_path, "boostsecurityio/trivy-fs")
+    result = has_test_definition(tmp_path, "boostsecurityio/trivy-fs")
     assert result is False
 
 
@@ -270,6 +312,60 @@ async def test_detect_changed_scanners_none_with_tests(tmp_path: Path) -> None:
     assert scanners == []
 
 
+async def test_detect_changed_scanners_removed_scanners(tmp_path: Path) -> None:
+    """detect_changed_scanners skips scanners whose directory no longer exists."""
+    scanner_dir = tmp_path / "scanners" / "boostsecurityio" / "scanner1"
+    scanner_dir.mkdir(parents=True)
+    (scanner_dir / "tests.yaml").write_text("version: 1.0\n")
+
+    changed_files = [
+        "scanners/boostsecurityio/scanner1/module.yaml",
+        "scanners/boostsecurityio/removed/module.yaml",
+        "scanners/removed-org/scanner/module.yaml",
+    ]
+
+    with (
+        patch(
+            "boostsec.registry_test_action.scanner_detector._get_changed_files",
+            return_value=changed_files,
+        ),
+        patch(
+            "boostsec.registry_test_action.scanner_detector._log_git_status",
+            return_value=None,
+        ),
+    ):
+        scanners = await detect_changed_scanners(tmp_path, "main", "HEAD")
+
+    assert scanners == ["boostsecurityio/scanner1"]
+
+
+async def test_detect_changed_scanners_stray_file(tmp_path: Path) -> None:
+    """detect_changed_scanners skips organizations that are not directories."""
+    scanner_dir = tmp_path / "scanners" / "boostsecurityio" / "scanner1"
+    scanner_dir.mkdir(parents=True)
+    (scanner_dir / "tests.yaml").write_text("version: 1.0\n")
+    (tmp_path / "scanners" / "stray").write_text("not an organization\n")
+
+    changed_files = [
+        "scanners/boostsecurityio/scanner1/module.yaml",
+        "scanners/stray/scanner/module.yaml",
+    ]
+
+    with (
+        patch(
+            "boostsec.registry_test_action.scanner_detector._get_changed_files",
+            return_value=changed_files,
+        ),
+        patch(
+            "boostsec.registry_test_action.scanner_detector._log_git_status",
+            return_value=None,
+        ),
+    ):
+        scanners = await detect_changed_scanners(tmp_path, "main", "HEAD")
+
+    assert scanners == ["boostsecurityio/scanner1"]
+
+
 async def test_detect_changed_scanners_no_changes(tmp_path: Path) -> None:
     """detect_changed_scanners returns empty list when no files changed."""
     with (
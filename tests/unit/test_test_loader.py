@@ -1,9 +1,13 @@
 """Tests for test definition loader."""
 
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from boostsec.registry_test_action import test_loader
+from boostsec.registry_test_action.models.test_definition import TestDefinition
 from boostsec.registry_test_action.test_loader import (
     load_all_tests,
     load_test_definition,
@@ -232,6 +236,29 @@ tests:
         await load_all_tests(tmp_path, ["org/scanner1", "org/scanner2"])
 
 
+async def test_load_all_tests_reports_first_failure_in_order(
+    tmp_path: Path,
+) -> None:
+    """load_all_tests raises the error of the first scanner that failed."""
+    scanner1_dir = tmp_path / "scanners" / "org" / "scanner1"
+    scanner1_dir.mkdir(parents=True)
+    (scanner1_dir / "tests.yaml").write_text("invalid: yaml: [")
+
+    parse_test_file = test_loader._parse_test_file
+
+    def slow_parse(test_file: Path) -> TestDefinition:
+        # Let the missing scanner2 file fail before scanner1 is parsed
+        if test_file.is_relative_to(scanner1_dir):
+            time.sleep(0.05)
+        return parse_test_file(test_file)
+
+    with (
+        patch.object(test_loader, "_parse_test_file", side_effect=slow_parse),
+        pytest.raises(ValueError, match="Invalid YAML"),
+    ):
+        await load_all_tests(tmp_path, ["org/scanner1", "org/scanner2"])
+
+
 async def test_load_all_tests_empty_list(tmp_path: Path) -> None:
     """load_all_tests returns empty dict for empty scanner list."""
     results = await load_all_tests(tmp_path, [])